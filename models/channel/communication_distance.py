@@ -50,7 +50,7 @@ class CommunicationDistanceCalculator:
         
         # Geometric factor
         geometric_factor = np.sin(theta1_rad) * np.sin(theta2_rad)
-        geometric_factor = max(geometric_factor, 0.1)  # Avoid division by zero
+        geometric_factor = np.maximum(geometric_factor, 0.1)  # Avoid division by zero
         
         # Scattering coefficient
         scattering_coefficient = 1.0
@@ -71,21 +71,33 @@ class CommunicationDistanceCalculator:
         Calculate OOK communication distance (Equation 1 from the paper)
         
         l_OOK = [−ηλPt / (hcξRd × ln(2Pe))]^(1/α)
-        """
-        # Calculate alpha and xi using calibration script logic
-        alpha = self._calculate_alpha(theta1, theta2)
-        xi = self._calculate_xi(theta1, theta2)
         
-        # Calculate ln(2Pe)
-        ln_2Pe = np.log(2 * self.Pe)
-        
-        numerator = -self.eta * self.lambda_ * Pt
-        denominator = self.h * self.c * xi * Rd * ln_2Pe
-        ratio = numerator / denominator
-        l_OOK = np.power(ratio, 1.0 / alpha)
+        Pt, Rd, theta1 and theta2 broadcast together, so any of them may be arrays.
+        """
+        scale, alpha = self.calculate_ook_coefficients(theta1, theta2)
+        l_OOK = np.power(scale * Pt / Rd, 1.0 / alpha)
         
         return l_OOK
     
+    def calculate_ook_coefficients(self, theta1, theta2) -> tuple:
+        """
+        (scale, alpha) such that l_OOK = (scale × Pt / Rd)^(1/alpha) for fixed
+        elevation angles, i.e. scale = −ηλ / (hcξ × ln(2Pe)).
+        theta1/theta2 may be arrays, giving one (scale, alpha) pair per element.
+        """
+        alpha = self._calculate_alpha(theta1, theta2)
+        xi = self._calculate_xi(theta1, theta2)
+        scale = -self.eta * self.lambda_ / (self.h * self.c * xi * np.log(2 * self.Pe))
+        return scale, alpha
+    
+    def calculate_ook_distance_vec(self, Pt, Rd, theta1, theta2) -> np.ndarray:
+        """
+        calculate_ook_distance broadcast over arrays of Pt, Rd, theta1 and/or theta2
+        """
+        return np.asarray(self.calculate_ook_distance(
+            *(np.asarray(v, dtype=np.float64) for v in (Pt, Rd, theta1, theta2))
+        ))
+    
     def calculate_distance_vs_power(self,
                                    Pt_range: np.ndarray,
                                    Rd: float,
@@ -94,11 +106,7 @@ class CommunicationDistanceCalculator:
         """
         Calculate distance for range of transmission powers
         """
-        distances = np.array([
-            self.calculate_ook_distance(Pt, Rd, theta1, theta2)
-            for Pt in Pt_range
-        ])
-        return distances
+        return self.calculate_ook_distance(np.asarray(Pt_range, dtype=np.float64), Rd, theta1, theta2)
     
     def calculate_distance_vs_rate(self,
                                   Pt: float,
@@ -106,11 +114,7 @@ class CommunicationDistanceCalculator:
                                   theta1: float,
                                   theta2: float) -> np.ndarray:
         
-        distances = np.array([
-            self.calculate_ook_distance(Pt, Rd, theta1, theta2)
-            for Rd in Rd_range
-        ])
-        return distances
+        return self.calculate_ook_distance(Pt, np.asarray(Rd_range, dtype=np.float64), theta1, theta2)
     
     def calculate_distance_vs_elevation(self,
                                        Pt: float,
@@ -172,9 +176,15 @@ class CommunicationDistanceCalculator:
                           Pt_max: float = 1.0,
                           tolerance: float = 0.001) -> float:
 
-        # Binary search
-        while (Pt_max - Pt_min) > 0.001:
-            Pt_mid = (Pt_min + Pt_max) / 2
+        if tolerance <= 0:
+            raise ValueError(f"Tolerance must be positive, got {tolerance}")
+
+        # Binary search with a fixed iteration count: halving until the
+        # bracket is within tolerance, so tight tolerances cannot stall on rounding
+        width = Pt_max - Pt_min
+        n_iter = int(np.ceil(np.log2(width / tolerance))) if width > tolerance else 0
+        for _ in range(n_iter):
+            Pt_mid = Pt_min + (Pt_max - Pt_min) * 0.5
             distance = self.calculate_ook_distance(Pt_mid, Rd, theta1, theta2)
             
             if distance < target_distance:
@@ -182,7 +192,7 @@ class CommunicationDistanceCalculator:
             else:
                 Pt_max = Pt_mid
         
-        return (Pt_min + Pt_max) / 2
+        return Pt_min + (Pt_max - Pt_min) * 0.5
     
     def find_supported_rate(self,
                           distance: float,
@@ -0,0 +1,36 @@
+"""
+CUDA versions of the connectivity kernels in m_connectivity.py.
+Imported only when a GPU sweep is requested (needs numba with a CUDA device).
+"""
+
+import os
+import sys
+import types
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from numba import cuda
+
+from models.connectivity import m_connectivity as _cpu
+
+
+def _rebind(kernel, **device_funcs):
+    """Device version of a CPU kernel whose calls to other kernels resolve to device functions"""
+    func = kernel.py_func
+    return cuda.jit(device=True)(types.FunctionType(
+        func.__code__, {**func.__globals__, **device_funcs}, func.__name__
+    ))
+
+
+_at_least_m_device = cuda.jit(device=True)(_cpu._at_least_m_kernel.py_func)
+_grid_Q_n_m_device = _rebind(_cpu._grid_Q_n_m_kernel, _at_least_m_kernel=_at_least_m_device)
+_connectivity_device = _rebind(_cpu._network_connectivity_kernel,
+                               _grid_Q_n_m_kernel=_grid_Q_n_m_device)
+
+
+@cuda.jit
+def connectivity_grid_kernel(l_arr, n_arr, out, m, area, sample_points):
+    """out[i, j] = connectivity probability for (l_arr[i], n_arr[j]); one thread per point"""
+    i, j = cuda.grid(2)
+    if i < out.shape[0] and j < out.shape[1]:
+        out[i, j] = _connectivity_device(l_arr[i], n_arr[j], m, area, sample_points)
@@ -12,61 +12,280 @@ Simple explanation:
 import numpy as np
 import sys
 import os
-from typing import Dict, List, Tuple
+from scipy import special
+from math import ceil, exp, lgamma, log, log1p, pi, sqrt
+from typing import Dict, List, Optional, Tuple
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
+from utils.jit import njit, prange, NUMBA_AVAILABLE
 from utils.statistics import StatisticsUtils
-from models.connectivity.adjacent_nodes import AdjacentNodesCalculator
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _at_least_m_kernel(trials, m, p):
+    """P(X >= m) for X ~ Bin(trials, p), summing whichever tail is short"""
+    if m <= 0:
+        return 1.0
+    if m > trials or p <= 0.0:
+        return 0.0
+    if p >= 1.0:
+        return 1.0
+    
+    log_p = log(p)
+    log_q = log1p(-p)
+    log_n_fact = lgamma(trials + 1.0)
+    
+    if m > trials * p:
+        # Upper tail: terms decrease from k = m, PMF(k+1) = PMF(k) * (n-k)/(k+1) * p/q
+        ratio = p / (1.0 - p)
+        term = exp(log_n_fact - lgamma(m + 1.0) - lgamma(trials - m + 1.0)
+                   + m * log_p + (trials - m) * log_q)
+        total = 0.0
+        k = m
+        while k <= trials:
+            total += term
+            if term <= 1e-17 * total:
+                break
+            term *= (trials - k) / (k + 1.0) * ratio
+            k += 1
+        return total
+    
+    # Below the mean the lower tail k < m is short and P(X >= m) is not small
+    cdf = 0.0
+    for k in range(m):
+        cdf += exp(log_n_fact - lgamma(k + 1.0) - lgamma(trials - k + 1.0)
+                   + k * log_p + (trials - k) * log_q)
+    return max(1.0 - cdf, 0.0)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _grid_Q_n_m_kernel(l, n, m, area, sample_points):
+    """
+    Q_n,≥m for scalar inputs: probability of at least m adjacent nodes
+    averaged over the sampling grid (MConnectivityCalculator.calculate_Q_n_m)
+    """
+    side = sqrt(area)
+    grid_size = int(ceil(sqrt(sample_points)))
+    spacing = side / (grid_size + 1)
+    
+    # calculate_adjacent_probability_simple with the per-position factor pulled out
+    full_coverage = (n - 1) / area * pi * l * l
+    
+    total = 0.0
+    for i in range(1, grid_size + 1):
+        x = i * spacing
+        for j in range(1, grid_size + 1):
+            y = j * spacing
+            dist_to_boundary = min(min(x, y), min(side - x, side - y))
+            if dist_to_boundary >= l:
+                P = full_coverage
+            else:
+                P = full_coverage * max(0.5, dist_to_boundary / l)
+            total += _at_least_m_kernel(n - 1, m, min(P, 1.0))
+    
+    return total / (grid_size * grid_size)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _network_connectivity_kernel(l, n, m, area, sample_points):
+    """
+    Equation 27 for scalar inputs: Q_n,≥m raised to the n-th power
+    """
+    return _grid_Q_n_m_kernel(l, n, m, area, sample_points) ** n
+
+
+@njit(parallel=True, cache=True)
+def _network_connectivity_sweep(l_arr, n_arr, m, area, sample_points, out):
+    """
+    _network_connectivity_kernel over paired 1-D l/n arrays, split across
+    cores, written into out (whose dtype sets the storage precision)
+    """
+    for i in prange(l_arr.shape[0]):
+        out[i] = _network_connectivity_kernel(l_arr[i], n_arr[i], m, area, sample_points)
+    return out
+
+
+def _grid_adjacency_probabilities(l: np.ndarray, n: np.ndarray, area: float,
+                                  sample_points: int, dtype=np.float64) -> np.ndarray:
+    """
+    Adjacency probability at every position of calculate_Q_n_m's sampling
+    grid, as in AdjacentNodesCalculator.calculate_adjacent_probability_simple;
+    shape l.shape + (grid_size**2,) for broadcast-compatible l and n.
+    """
+    side = np.sqrt(area)
+    
+    grid_size = int(np.ceil(np.sqrt(sample_points)))
+    spacing = side / (grid_size + 1)
+    coords = np.arange(1, grid_size + 1) * spacing
+    x, y = np.meshgrid(coords, coords, indexing='ij')
+    
+    # Distance to nearest boundary for every sample position (flattened)
+    dist_to_boundary = np.minimum(np.minimum(x, y),
+                                  np.minimum(side - x, side - y)).ravel().astype(dtype)
+    
+    l_col = np.asarray(l, dtype=dtype)[..., np.newaxis]
+    boundary_factor = np.where(dist_to_boundary >= l_col, dtype(1.0),
+                               np.maximum(dtype(0.5), dist_to_boundary / l_col))
+    density = ((np.asarray(n)[..., np.newaxis] - 1) / area).astype(dtype)
+    return np.minimum(density * np.pi * l_col ** 2 * boundary_factor, 1.0)
+
+
+# Above this adjacency probability the Monte-Carlo path uses the exact binomial tail
+_MC_SPARSE_P = 0.1
+
+
+def _at_least_m_mc(trials: int, m: int, p: float, mc_trials: int,
+                   rng: np.random.Generator) -> float:
+    """
+    Monte-Carlo P(X >= m) for X ~ Bin(trials, p). Rather than drawing every
+    Bernoulli slot, draw the gaps between successes: they are Geometric(p)
+    (mean 1/p), and X >= m exactly when the first m gaps fit within the
+    trials slots, so each sample costs m draws instead of `trials`.
+    """
+    if m <= 0:
+        return 1.0
+    if m > trials or p <= 0.0:
+        return 0.0
+    if p >= _MC_SPARSE_P:
+        return StatisticsUtils.probability_at_least_m_adjacent(trials + 1, m, p)
+    
+    gaps = rng.geometric(p, size=(mc_trials, m))
+    return float(np.mean(gaps.sum(axis=1) <= trials))
+
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from cache) now rather than inside the first plot loop
+    _network_connectivity_kernel(95.0, 100, 2, 1e6, 20)
 
 
 class MConnectivityCalculator:
     @staticmethod
     def calculate_Q_n_m(l: float, n: int, m: int, area: float,
                        sample_points: int = 20) -> float:
-        side = np.sqrt(area)
+        # Same grid kernel as the Equation 27 path, so Q_n,≥m has one implementation
+        return _grid_Q_n_m_kernel(float(l), int(n), int(m), float(area), int(sample_points))
+    
+    @staticmethod
+    def calculate_network_connectivity_probability(l: float, n: int, m: int,
+                                                  area: float,
+                                                  sample_points: int = 20,
+                                                  method: str = 'grid',
+                                                  mc_trials: int = 10000,
+                                                  seed: Optional[int] = None) -> float:
+        """
+        method='grid' averages Q_n,≥m over a grid of sample positions (boundary
+        effects included); method='analytic' uses the closed form for a node
+        far from the boundary, P = (n-1)/area × πl² (the interior case of
+        calculate_adjacent_probability_simple), with no sampling.
+        method='mc' is a Monte-Carlo check of 'grid': at each grid position
+        with sparse adjacency (P < 0.1) P(X >= m) is estimated from mc_trials
+        geometric-gap samples, otherwise the exact binomial tail is used.
+        """
+        if method == 'analytic':
+            p = min((n - 1) / area * np.pi * l ** 2, 1.0)
+            return StatisticsUtils.probability_at_least_m_adjacent(int(n), int(m), p) ** n
+        if method == 'mc':
+            rng = np.random.default_rng(seed)
+            P = _grid_adjacency_probabilities(float(l), int(n), area, sample_points)
+            Q_n_m = np.mean([_at_least_m_mc(int(n) - 1, int(m), p, mc_trials, rng) for p in P])
+            return Q_n_m ** n
+        if method != 'grid':
+            raise ValueError(f"Unknown method: {method}")
         
-        # Sample points throughout the network
-        # Use grid sampling for better coverage
-        grid_size = int(np.ceil(np.sqrt(sample_points)))
-        spacing = side / (grid_size + 1)
+        # P(C is m-connected) ≈ (Q_n,≥m)^n (Equations 25 and 27), compiled kernel
+        return _network_connectivity_kernel(float(l), int(n), int(m),
+                                            float(area), int(sample_points))
+    
+    @staticmethod
+    def calculate_Q_n_m_vec(l, n, m: int, area: float,
+                            sample_points: int = 20, dtype=np.float64) -> np.ndarray:
+        """
+        Q_n,≥m (Equation 25) for arrays of l and/or n, broadcast together.
+        Same sampling grid and adjacency model as calculate_Q_n_m, evaluated
+        in one pass instead of one Python call per (l, n) pair.
+        dtype=np.float32 halves memory traffic where percent-level accuracy is enough.
+        """
+        l, n = np.broadcast_arrays(np.asarray(l, dtype=dtype), np.asarray(n))
+        P = _grid_adjacency_probabilities(l, n, area, sample_points, dtype)
+        
+        # P(X >= m) for X ~ Bin(n - 1, P) = I_P(m, n - m)
+        n_col = n[..., np.newaxis]
+        if m <= 0:
+            at_least_m = np.ones_like(P)
+        else:
+            at_least_m = np.where(m < n_col,
+                                  special.betainc(dtype(m), np.maximum(n_col - m, 1).astype(dtype), P),
+                                  dtype(0.0))
         
-        probabilities = []
+        return at_least_m.mean(axis=-1)
+    
+    @staticmethod
+    def calculate_network_connectivity_probability_vec(l, n, m: int, area: float,
+                                                       sample_points: int = 20,
+                                                       method: str = 'grid',
+                                                       dtype=np.float64) -> np.ndarray:
+        """
+        Vectorized calculate_network_connectivity_probability over l and/or n
+        arrays. dtype=np.float32 stores inputs and results in single precision
+        (plenty for percent-scale plots); float64 is the reference path.
+        """
+        if method == 'analytic':
+            l, n = np.broadcast_arrays(np.asarray(l, dtype=np.float64), np.asarray(n))
+            p = np.minimum((n - 1) / area * np.pi * l ** 2, 1.0)
+            if m <= 0:
+                at_least_m = np.ones_like(p)
+            else:
+                # P(X >= m) for X ~ Bin(n - 1, p) = I_p(m, n - m)
+                at_least_m = np.where(m < n, special.betainc(m, np.maximum(n - m, 1), p), 0.0)
+            return np.power(at_least_m, n).astype(dtype, copy=False)
+        if method != 'grid':
+            raise ValueError(f"Unknown method: {method}")
         
-        for i in range(1, grid_size + 1):
-            for j in range(1, grid_size + 1):
-                # Cartesian position
-                x = i * spacing
-                y = j * spacing
-                
-                # Convert to polar
-                tx = np.sqrt(x**2 + y**2)
-                phi_x = np.arctan2(y, x)
-                
-                # Calculate probability at this position
-                prob = AdjacentNodesCalculator.probability_at_least_m_adjacent(
-                    tx, phi_x, l, n, m, area
-                )
-                
-                probabilities.append(prob)
+        if NUMBA_AVAILABLE:
+            shape = np.broadcast(l, n).shape
+            l_flat = np.broadcast_to(l, shape).astype(dtype).ravel()
+            n_flat = np.broadcast_to(n, shape).astype(np.int64).ravel()
+            out = np.empty(l_flat.size, dtype=dtype)
+            _network_connectivity_sweep(l_flat, n_flat, int(m), float(area),
+                                        int(sample_points), out)
+            return out.reshape(shape)
         
-        # Average probability across all sampled positions
-        Q_n_m = np.mean(probabilities)
+        Q_n_m = MConnectivityCalculator.calculate_Q_n_m_vec(l, n, m, area, sample_points, dtype)
         
-        return Q_n_m
+        # P(C is m-connected) ≈ (Q_n,≥m)^n (Equation 27)
+        return np.power(Q_n_m, np.asarray(n)).astype(dtype, copy=False)
     
     @staticmethod
-    def calculate_network_connectivity_probability(l: float, n: int, m: int,
-                                                  area: float,
-                                                  sample_points: int = 20) -> float:
-        # Calculate Q_n,≥m (Equation 25)
-        Q_n_m = MConnectivityCalculator.calculate_Q_n_m(l, n, m, area, sample_points)
+    def calculate_connectivity_grid(l_values, n_values, m: int, area: float,
+                                    sample_points: int = 20,
+                                    use_gpu: bool = False) -> np.ndarray:
+        """
+        Network m-connectivity probability on the (len(l_values), len(n_values))
+        grid of every (l, n) pair. use_gpu=True launches one CUDA thread per
+        grid point (needs numba and a CUDA device).
+        """
+        l_values = np.asarray(l_values, dtype=np.float64).ravel()
+        n_values = np.asarray(n_values, dtype=np.int64).ravel()
+        
+        if not use_gpu:
+            return MConnectivityCalculator.calculate_network_connectivity_probability_vec(
+                l_values[:, np.newaxis], n_values[np.newaxis, :], m, area, sample_points
+            )
         
-        # Calculate network probability (Equation 27)
-        # P(C is m-connected) ≈ (Q_n,≥m)^n
-        network_prob = Q_n_m ** n
+        if not NUMBA_AVAILABLE:
+            raise RuntimeError("use_gpu=True requires numba with CUDA support")
+        from numba import cuda
+        if not cuda.is_available():
+            raise RuntimeError("use_gpu=True requires a CUDA-capable GPU")
+        from models.connectivity._cuda_kernels import connectivity_grid_kernel
         
-        return network_prob
+        out = cuda.device_array((l_values.size, n_values.size), dtype=np.float64)
+        threads = (16, 16)
+        blocks = (-(-l_values.size // threads[0]), -(-n_values.size // threads[1]))
+        connectivity_grid_kernel[blocks, threads](cuda.to_device(l_values), cuda.to_device(n_values), out,
+                                int(m), float(area), int(sample_points))
+        return out.copy_to_host()
     
     @staticmethod
     def analyze_connectivity_levels(l: float, n: int, area: float,
@@ -15,7 +15,7 @@ import numpy as np
 import sys
 import os
 from typing import List, Tuple
-from utils.geometry import GeometryUtils
+from utils.geometry import GeometryUtils, euclidean_distance_2d, points_in_circle_mask
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
@@ -30,7 +30,7 @@ class BooleanCoverageModel:
         nx, ny = node_position
         
         # Calculate distance
-        distance = GeometryUtils.euclidean_distance_2d(px, py, nx, ny)
+        distance = euclidean_distance_2d(px, py, nx, ny)
         
         # Boolean coverage (Equation 2)
         # p(X) = 1 if d(O, X) < R, else 0
@@ -45,6 +45,15 @@ class BooleanCoverageModel:
                 return True
         return False
     
+    @staticmethod
+    def _grid_coverage_mask(x_points: np.ndarray, y_points: np.ndarray,
+                            node_positions: List[Tuple[float, float]],
+                            coverage_radius: float) -> np.ndarray:
+        # (n_nodes, n_y * n_x) coverage mask, grid flattened row-major over y
+        X, Y = np.meshgrid(x_points, y_points)
+        points = np.column_stack([X.ravel(), Y.ravel()])
+        return points_in_circle_mask(node_positions, points, coverage_radius)
+    
     @staticmethod
     def calculate_coverage_rate(point: Tuple[float, float],
                                node_position: Tuple[float, float],
@@ -75,20 +84,16 @@ class BooleanCoverageModel:
         x_points = np.linspace(x_min, x_max, grid_resolution)
         y_points = np.linspace(y_min, y_max, grid_resolution)
         
-        covered_count = 0
-        total_count = 0
+        total_count = x_points.size * y_points.size
+        if total_count == 0:
+            return 0.0
         
-        # Check each grid point
-        for x in x_points:
-            for y in y_points:
-                point = (x, y)
-                if BooleanCoverageModel.is_point_covered_by_network(
-                    point, node_positions, coverage_radius
-                ):
-                    covered_count += 1
-                total_count += 1
+        # Check every grid point against every node in one pass
+        covered = BooleanCoverageModel._grid_coverage_mask(
+            x_points, y_points, node_positions, coverage_radius
+        ).any(axis=0)
         
-        coverage_ratio = covered_count / total_count if total_count > 0 else 0.0
+        coverage_ratio = np.count_nonzero(covered) / total_count
         return coverage_ratio
     
     @staticmethod
@@ -102,19 +107,13 @@ class BooleanCoverageModel:
         x_points = np.linspace(x_min, x_max, grid_resolution)
         y_points = np.linspace(y_min, y_max, grid_resolution)
         
-        # Initialize coverage map
-        coverage_map = np.zeros((grid_resolution, grid_resolution))
-        
-        # Fill coverage map
-        for i, y in enumerate(y_points):
-            for j, x in enumerate(x_points):
-                point = (x, y)
-                if BooleanCoverageModel.is_point_covered_by_network(
-                    point, node_positions, coverage_radius
-                ):
-                    coverage_map[i, j] = 1.0
+        # Fill coverage map (rows follow y, columns follow x)
+        mask = BooleanCoverageModel._grid_coverage_mask(
+            x_points, y_points, node_positions, coverage_radius
+        )
+        coverage_map = mask.any(axis=0).reshape(grid_resolution, grid_resolution)
         
-        return coverage_map
+        return coverage_map.astype(float)
     
     @staticmethod
     def generate_redundancy_map(region_bounds: Tuple[float, float, float, float],
@@ -126,15 +125,10 @@ class BooleanCoverageModel:
         x_points = np.linspace(x_min, x_max, grid_resolution)
         y_points = np.linspace(y_min, y_max, grid_resolution)
         
-        redundancy_map = np.zeros((grid_resolution, grid_resolution))
-        
-        for i, y in enumerate(y_points):
-            for j, x in enumerate(x_points):
-                point = (x, y)
-                count = BooleanCoverageModel.count_covering_nodes(
-                    point, node_positions, coverage_radius
-                )
-                redundancy_map[i, j] = count
+        mask = BooleanCoverageModel._grid_coverage_mask(
+            x_points, y_points, node_positions, coverage_radius
+        )
+        redundancy_map = mask.sum(axis=0).reshape(grid_resolution, grid_resolution).astype(float)
         
         return redundancy_map
 
@@ -19,6 +19,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from utils.geometry import GeometryUtils
 
+# S2 / l² (Equation 12), evaluated once at import
+_S2_COEFF = 1 - np.pi/6 - np.sqrt(3)/4
+
 
 class EffectiveCoverageCalculator:
     # Coverage efficiency from Equation 28
@@ -55,7 +58,7 @@ class EffectiveCoverageCalculator:
     @staticmethod
     def calculate_S2(l: float) -> float:
         # Equation 12: S2 = (1 - π/6 - √3/4) × l²
-        S2 = (1 - np.pi/6 - np.sqrt(3)/4) * l**2
+        S2 = _S2_COEFF * l**2
         return S2
     
     @staticmethod
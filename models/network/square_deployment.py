@@ -18,7 +18,7 @@ from typing import List, Tuple, Dict
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from models.network.effective_coverage import EffectiveCoverageCalculator
-from utils.geometry import GeometryUtils
+from utils.geometry import euclidean_distance_2d
 
 
 class SquareNetworkDeployment:
@@ -124,7 +124,7 @@ class SquareNetworkDeployment:
     
     def calculate_inter_node_distance(self, pos1: Tuple[float, float], 
                                      pos2: Tuple[float, float]) -> float:
-        return GeometryUtils.euclidean_distance_2d(
+        return euclidean_distance_2d(
             pos1[0], pos1[1], pos2[0], pos2[1]
         )
     
@@ -18,6 +18,8 @@ from models.node.hexahedral_terminal import HexahedralTerminal
 from models.network.boolean_coverage import BooleanCoverageModel
 from models.network.effective_coverage import EffectiveCoverageCalculator
 from models.network.square_deployment import SquareNetworkDeployment
+from utils.geometry import (pairwise_sqdist, points_in_circle_mask,
+                            generate_square_network_positions, to_xy)
 
 
 class Phase2TestSuite:
@@ -74,6 +76,8 @@ class Phase2TestSuite:
         self.test_boolean_coverage()
         self.test_effective_coverage()
         self.test_square_deployment()
+        self.test_coverage_dashboard()
+        self.test_batch_geometry()
         self.test_integration_with_phase1()
         self.test_paper_validation()
         
@@ -295,6 +299,95 @@ class Phase2TestSuite:
                  isinstance(neighbors, list),
                  f"node 0 has {len(neighbors)} neighbor(s)")
     
+    def test_coverage_dashboard(self):
+        """Test the coverage comparison dashboard"""
+        print("\n--- Testing Coverage Dashboard ---")
+        
+        from visualization._style import batch_pyplot
+        from visualization.coverage_plotter import CoveragePlotter
+        
+        plt = batch_pyplot()
+        plotter = CoveragePlotter()
+        calc = CommunicationDistanceCalculator()
+        combinations = [(30, 30), (30, 50)]
+        fig = plotter.create_coverage_comparison_dashboard(combinations=combinations)
+        
+        self.test("Dashboard has four panels",
+                 len(fig.axes) == 4,
+                 f"{len(fig.axes)} axes")
+        
+        # Top-left panel: 4-node coverage vs power at Rd = 50 kbps (×10⁴ m²)
+        Pt_range = np.linspace(0.1, 0.5, 15)
+        l_power = calc.calculate_ook_distance(Pt_range, 50e3, 30, 50)
+        expected = EffectiveCoverageCalculator.calculate_four_node_effective_coverage(l_power) / 1e4
+        drawn = fig.axes[0].lines[1].get_ydata()
+        self.test("4-node panel matches Equation 15",
+                 np.allclose(drawn, expected, rtol=1e-5),
+                 f"max |diff| = {np.max(np.abs(drawn - expected)):.2e} ×10⁴ m²")
+        
+        # Bottom-right panel: single-node coverage vs rate at Pt = 0.5 W (×10³ m²)
+        Rd_range = np.linspace(10e3, 120e3, 15)
+        l_rate = calc.calculate_ook_distance(0.5, Rd_range, 30, 30)
+        expected = EffectiveCoverageCalculator.calculate_single_node_effective_coverage(l_rate) / 1e3
+        drawn = fig.axes[3].lines[0].get_ydata()
+        self.test("Single-node panel matches Equation 17",
+                 np.allclose(drawn, expected, rtol=1e-5),
+                 f"max |diff| = {np.max(np.abs(drawn - expected)):.2e} ×10³ m²")
+        
+        # Both network types rescale the same two l² sweeps
+        info = plotter._l_sq_cache.cache_info()
+        self.test("Dashboard computes each l² sweep once (bounded cache)",
+                 info.misses == 2 and info.maxsize is not None,
+                 f"{info.misses} sweeps computed, maxsize={info.maxsize}")
+        plt.close(fig)
+    
+    def test_batch_geometry(self):
+        """Test batched distance helpers"""
+        print("\n--- Testing Batched Geometry ---")
+        
+        from scipy.spatial.distance import cdist
+        
+        rng = np.random.default_rng(0)
+        A = rng.uniform(0, 1000, size=(37, 2))
+        B = rng.uniform(0, 1000, size=(53, 2))
+        
+        # Chunked ||a||² + ||b||² - 2a·b against the direct computation
+        expected = cdist(A, B) ** 2
+        sqdist = pairwise_sqdist(A, B, chunk_size=16)
+        self.test("pairwise_sqdist matches cdist²",
+                 sqdist.shape == (37, 53) and np.allclose(sqdist, expected, rtol=1e-9, atol=1e-6),
+                 f"max |diff| = {np.max(np.abs(sqdist - expected)):.2e} m²")
+        
+        # Points exactly on the circle are outside (strict <)
+        centers = np.array([[0.0, 0.0]])
+        points = np.array([[3.0, 4.0], [2.999, 4.0], [0.0, 5.0], [0.0, 0.0]])
+        mask = points_in_circle_mask(centers, points, 5.0)
+        self.test("points_in_circle_mask excludes the boundary",
+                 mask.tolist() == [[False, True, False, True]],
+                 f"mask = {mask.astype(int).tolist()}")
+        
+        # Grid positions: 7 nodes on a 3×3 grid, filled column by column
+        expected = [(i * 500.0, j * 500.0) for i in range(3) for j in range(3)][:7]
+        positions = generate_square_network_positions(7, 1000)
+        self.test("Square network positions as (n, 2) array",
+                 positions.shape == (7, 2) and positions.dtype == np.float64
+                 and np.array_equal(positions, expected),
+                 f"shape = {positions.shape}, last = {positions[-1].tolist()}")
+        
+        legacy = generate_square_network_positions(7, 1000, legacy_tuples=True)
+        self.test("Square network positions as legacy tuples",
+                 isinstance(legacy, list) and all(isinstance(p, tuple) for p in legacy)
+                 and legacy == expected,
+                 f"{len(legacy)} tuples, last = {legacy[-1]}")
+        
+        xs, ys = to_xy(positions)
+        xs_legacy, ys_legacy = to_xy(legacy)
+        self.test("to_xy splits into contiguous axes",
+                 xs.flags['C_CONTIGUOUS'] and ys.flags['C_CONTIGUOUS']
+                 and np.array_equal(xs, positions[:, 0]) and np.array_equal(ys, positions[:, 1])
+                 and np.array_equal(xs_legacy, xs) and np.array_equal(ys_legacy, ys),
+                 f"xs = {xs.tolist()}")
+    
     def test_integration_with_phase1(self):
         """Test integration with Phase 1 modules"""
         print("\n--- Testing Phase 1 Integration ---")
@@ -311,6 +404,17 @@ class Phase2TestSuite:
                  coverage > 0,
                  f"coverage = {coverage:.2f} m² at l={distance:.2f}m")
         
+        # Power search rejects a tolerance it could never reach
+        rejected = []
+        for tolerance in (0.0, -0.001):
+            try:
+                calc.find_required_power(distance, 50e3, 30, 50, tolerance=tolerance)
+            except ValueError:
+                rejected.append(tolerance)
+        self.test("Non-positive power tolerance rejected",
+                 rejected == [0.0, -0.001],
+                 f"rejected {rejected}")
+        
         # Test deployment with Phase 1 distance
         deployer = SquareNetworkDeployment(distance)
         network = deployer.create_four_node_network()
@@ -13,7 +13,8 @@ from models.connectivity.probability_density import ProbabilityDensityFunction,
 from models.connectivity.adjacent_nodes import AdjacentNodesCalculator
 from models.connectivity.m_connectivity import MConnectivityCalculator
 from models.connectivity.network_robustness import NetworkRobustnessAnalyzer
-from utils.statistics import StatisticsUtils
+from utils.statistics import (StatisticsUtils, ConnectivityStatistics,
+                              log_probability_at_least_m_adjacent)
 
 
 class Phase3TestSuite:
@@ -66,7 +67,12 @@ class Phase3TestSuite:
         
         self.test_probability_density()
         self.test_adjacent_nodes()
+        self.test_adjacent_integration()
+        self.test_gl_quadrature()
+        self.test_monte_carlo_estimate()
         self.test_m_connectivity()
+        self.test_connectivity_threshold_sweep()
+        self.test_log_tail_probability()
         self.test_network_robustness()
         self.test_integration_phases_1_2_3()
         self.test_paper_validation()
@@ -213,6 +219,127 @@ class Phase3TestSuite:
                  center_analysis['expected_neighbors'] >= edge_analysis['expected_neighbors'],
                  f"Center: {center_analysis['expected_neighbors']:.2f}, Edge: {edge_analysis['expected_neighbors']:.2f}")
     
+    def test_adjacent_integration(self):
+        """Test the empty-region precheck in ConnectivityIntegrator"""
+        print("\n--- Testing Adjacent Probability Integration ---")
+        
+        from scipy import integrate
+        import utils.integration as integration_utils
+        
+        area = 1e6
+        pdf = lambda x, y: 1 / area
+        
+        def full_integration(tx, phi_x, l):
+            # Equation 20 integrated without the precheck
+            offset = np.arcsin(l / tx)
+            center = np.arcsin(np.sin(phi_x))
+            
+            def t_bound(phi, sign):
+                cos_term = tx * np.cos(phi - phi_x)
+                sqrt_term = cos_term**2 - (tx**2 - l**2)
+                return 0 if sqrt_term < 0 else cos_term + sign * np.sqrt(sqrt_term)
+            
+            result, _ = integrate.dblquad(
+                lambda phi, t: pdf(t * np.cos(phi), t * np.sin(phi)) * t,
+                center - offset, center + offset,
+                lambda phi: t_bound(phi, -1), lambda phi: t_bound(phi, 1),
+                epsabs=1e-6, epsrel=1e-6
+            )
+            return result
+        
+        calls = []
+        dblquad = integration_utils._dblquad
+        
+        def counting_dblquad(*args, **kwargs):
+            calls.append(args)
+            return dblquad(*args, **kwargs)
+        
+        integration_utils._dblquad = counting_dblquad
+        try:
+            # Unreachable: the phi window never lines up with the node bearing
+            tx, phi_x, l = 400, 2.5, 200
+            prob = integration_utils.ConnectivityIntegrator.integrate_adjacent_probability(
+                pdf, (tx, phi_x), l
+            )
+            self.test("Unreachable region skips dblquad",
+                     prob == 0.0 and prob == full_integration(tx, phi_x, l) and not calls,
+                     f"P = {prob}, dblquad calls = {len(calls)}")
+            
+            # Borderline: tx == l, and a region open only at the window edge
+            for tx, phi_x, l in [(100, 0.0, 100), (400, 2.5, 400 * np.sin(0.95))]:
+                del calls[:]
+                prob = integration_utils.ConnectivityIntegrator.integrate_adjacent_probability(
+                    pdf, (tx, phi_x), l
+                )
+                expected = full_integration(tx, phi_x, l)
+                self.test(f"Borderline region integrated (tx={tx}, l={l:.1f})",
+                         len(calls) == 1 and np.isclose(prob, expected, rtol=1e-9, atol=1e-12),
+                         f"P = {prob:.6e}, full integration {expected:.6e}")
+        finally:
+            integration_utils._dblquad = dblquad
+    
+    def test_gl_quadrature(self):
+        """Test the Gauss-Legendre default against adaptive dblquad"""
+        print("\n--- Testing Gauss-Legendre Quadrature ---")
+        
+        from utils.integration import IntegrationUtils
+        
+        f_polar = lambda r, phi: np.exp(-r) * (1 + np.cos(phi)**2)
+        f_xy = lambda x, y: np.exp(-(x**2 + y**2) / 50)
+        
+        def region_integrals():
+            return {
+                'polar': IntegrationUtils.integrate_polar(f_polar, (0, 2), (0, np.pi))[0],
+                'circular': IntegrationUtils.integrate_circular_segment(f_xy, (1, 2), 3)[0],
+                'elliptical': IntegrationUtils.integrate_elliptical_region(
+                    f_xy, (1, -1), 4, 2, rotation=np.pi/6)[0],
+            }
+        
+        adaptive = region_integrals()
+        IntegrationUtils.set_default_quadrature('gl')
+        try:
+            gauss = region_integrals()
+        finally:
+            IntegrationUtils.set_default_quadrature()
+        
+        for region in adaptive:
+            self.test(f"GL matches dblquad ({region})",
+                     np.isclose(gauss[region], adaptive[region], rtol=1e-8),
+                     f"{gauss[region]:.10f} vs {adaptive[region]:.10f}")
+        
+        self.test("Default quadrature restored",
+                 IntegrationUtils.integrate_polar(f_polar, (0, 2), (0, np.pi))[1] > 0,
+                 "dblquad error estimate reported again")
+    
+    def test_monte_carlo_estimate(self):
+        """Test Sobol Monte Carlo integration"""
+        print("\n--- Testing Sobol Monte Carlo Estimate ---")
+        
+        bounds = [(0, 1), (0, 2)]
+        exact = 1.0  # ∫∫ x·y over [0, 1] × [0, 2]
+        batch_sizes = []
+        
+        def f(x, y):
+            batch_sizes.append(np.size(x))
+            return x * y
+        
+        first = StatisticsUtils.monte_carlo_estimate(f, 1000, bounds, seed=7, method='sobol')
+        second = StatisticsUtils.monte_carlo_estimate(f, 1000, bounds, seed=7, method='sobol')
+        self.test("Seeded Sobol estimate is deterministic",
+                 first == second,
+                 f"{first[0]:.6f} ± {first[1]:.6f}")
+        
+        self.test("Non-power-of-two n_samples evaluates exactly n points",
+                 batch_sizes == [1000, 1000],
+                 f"batch sizes = {batch_sizes}")
+        
+        # Scrambling randomizes the points, so the mean over seeds is unbiased
+        estimates = [StatisticsUtils.monte_carlo_estimate(f, 1000, bounds, seed=seed)[0]
+                     for seed in range(32)]
+        self.test("Sobol estimate unbiased across seeds",
+                 abs(np.mean(estimates) - exact) < 1e-3 and abs(first[0] - exact) < first[1],
+                 f"mean = {np.mean(estimates):.6f}, exact = {exact}")
+    
     def test_m_connectivity(self):
         """Test m-connectivity calculations"""
         print("\n--- Testing m-Connectivity Calculator ---")
@@ -253,6 +380,93 @@ class Phase3TestSuite:
                  prob_1conn >= prob_2conn >= prob_3conn,
                  f"{prob_1conn:.4f} ≥ {prob_2conn:.4f} ≥ {prob_3conn:.4f}")
         
+        # Test that Equation 27 is exactly Q_n,≥m raised to the n-th power
+        # (short range and few nodes, so Q_n,≥m is well inside (0, 1))
+        l_short, n_sparse = 30, 30
+        Q_sparse = [MConnectivityCalculator.calculate_Q_n_m(l_short, n_sparse, m, area)
+                    for m in (1, 2, 3)]
+        prob_sparse = [MConnectivityCalculator.calculate_network_connectivity_probability(
+                           l_short, n_sparse, m, area)
+                       for m in (1, 2, 3)]
+        self.test("P(m-conn) = Q_n,≥m^n",
+                 np.allclose(prob_sparse, np.power(Q_sparse, n_sparse), rtol=1e-12, atol=0.0),
+                 f"n={n_sparse}: Q_n,≥1..3 = {np.round(Q_sparse, 4)}")
+        
+        # Test that the compiled Q_n,≥m matches the per-position adjacency model
+        grid_size = int(np.ceil(np.sqrt(20)))
+        spacing = np.sqrt(area) / (grid_size + 1)
+        Q_model = [np.mean([
+            AdjacentNodesCalculator.probability_at_least_m_adjacent(
+                np.hypot(i * spacing, j * spacing), np.arctan2(j, i), l_short, n_sparse, m, area
+            )
+            for i in range(1, grid_size + 1) for j in range(1, grid_size + 1)
+        ]) for m in (1, 2, 3)]
+        self.test("Q_n,≥m matches AdjacentNodesCalculator grid average",
+                 np.allclose(Q_sparse, Q_model, rtol=1e-9, atol=0.0),
+                 f"max |diff| = {np.max(np.abs(np.subtract(Q_sparse, Q_model))):.2e}")
+        
+        # Test method='analytic' against the grid: identical while every grid
+        # position is at least l from the boundary (spacing ≈ 167 m here)...
+        prob_analytic = [MConnectivityCalculator.calculate_network_connectivity_probability(
+                             l_short, n_sparse, m, area, method='analytic')
+                         for m in (1, 2, 3)]
+        self.test("Analytic method matches grid away from the boundary",
+                 np.allclose(prob_analytic, prob_sparse, rtol=1e-9, atol=0.0),
+                 f"analytic {prob_analytic[0]:.6f}, grid {prob_sparse[0]:.6f}")
+        
+        # ...and an upper bound once boundary positions lose coverage
+        l_long, n_few = 200, 5
+        grid_long = [MConnectivityCalculator.calculate_network_connectivity_probability(
+                         l_long, n_few, m, area)
+                     for m in (1, 2)]
+        analytic_long = [MConnectivityCalculator.calculate_network_connectivity_probability(
+                             l_long, n_few, m, area, method='analytic')
+                         for m in (1, 2)]
+        self.test("Analytic method bounds grid near the boundary",
+                 all(a >= g for a, g in zip(analytic_long, grid_long)),
+                 f"l={l_long}: analytic {analytic_long[0]:.4f} ≥ grid {grid_long[0]:.4f}")
+        
+        # Test seeded method='mc': every position samples P < 0.1, so Q_n,≥m is
+        # averaged from 25 positions × 10000 draws; compare within 4 standard errors
+        prob_mc = [MConnectivityCalculator.calculate_network_connectivity_probability(
+                       l_short, n_sparse, m, area, method='mc', mc_trials=10000, seed=0)
+                   for m in (1, 2, 3)]
+        Q_mc = np.power(prob_mc, 1.0 / n_sparse)
+        Q_exact = np.asarray(Q_sparse)
+        std_err = np.sqrt(Q_exact * (1 - Q_exact) / (grid_size ** 2 * 10000))
+        z = np.abs(Q_mc - Q_exact) / std_err
+        self.test("Monte-Carlo method within 4σ of analytic",
+                 np.all(z < 4),
+                 f"|z| = {np.round(z, 2)}")
+        
+        prob_mc_again = MConnectivityCalculator.calculate_network_connectivity_probability(
+            l_short, n_sparse, 1, area, method='mc', mc_trials=10000, seed=0
+        )
+        self.test("Monte-Carlo method is reproducible with a seed",
+                 prob_mc_again == prob_mc[0],
+                 f"P(1-conn) = {prob_mc[0]:.6f}")
+        
+        # Test m close to n in large networks, where the binomial tail terms
+        # under- and overflow individually. l is chosen so every grid position
+        # is interior with P = (n-1)/area × πl², making Q_n,≥m = binom.sf(m-1, n-1, P)
+        from scipy import stats
+        errors = []
+        for n_large, m_large, P in [(300, 280, 0.95), (1000, 500, 0.7), (500, 450, 0.9)]:
+            l_large = np.sqrt(P * area / ((n_large - 1) * np.pi))
+            expected = stats.binom.sf(m_large - 1, n_large - 1, P)
+            Q_large = MConnectivityCalculator.calculate_Q_n_m(l_large, n_large, m_large, area)
+            prob_large = MConnectivityCalculator.calculate_network_connectivity_probability(
+                l_large, n_large, m_large, area)
+            prob_large_vec = MConnectivityCalculator.calculate_network_connectivity_probability_vec(
+                l_large, n_large, m_large, area)
+            errors += [abs(Q_large - expected) / expected,
+                       abs(prob_large - expected ** n_large) / expected ** n_large,
+                       abs(float(prob_large_vec) - expected ** n_large) / expected ** n_large]
+        # NaN compares false, so it fails here rather than vanishing in a max()
+        self.test("Large n, m close to n matches binom.sf",
+                 np.all(np.array(errors) < 1e-9),
+                 f"max relative error = {np.max(errors):.2e}")
+        
         # Test that more nodes → higher connectivity
         prob_50 = MConnectivityCalculator.calculate_network_connectivity_probability(
             l, 10, 2, area
@@ -289,6 +503,55 @@ class Phase3TestSuite:
                  'network_config' in summary and 'connectivity_levels' in summary,
                  f"Expected neighbors: {summary['expected_neighbors']:.2f}")
     
+    def test_connectivity_threshold_sweep(self):
+        """Test the interpolated connectivity thresholds"""
+        print("\n--- Testing Connectivity Threshold Sweep ---")
+        
+        targets = np.array([0.1, 0.5, 0.9, 0.99])
+        worst = 0.0
+        for n, m in [(20, 1), (50, 2), (100, 3), (300, 2)]:
+            swept = ConnectivityStatistics.calculate_connectivity_threshold_sweep(n, m, targets)
+            solved = [ConnectivityStatistics.calculate_connectivity_threshold(n, m, target,
+                                                                              tolerance=1e-8)
+                      for target in targets]
+            worst = max(worst, np.max(np.abs(swept - solved)))
+        
+        # Linear interpolation on a 1001-point p grid
+        self.test("Threshold sweep matches root-finding thresholds",
+                 worst < 1e-4,
+                 f"max |Δp| = {worst:.2e}")
+    
+    def test_log_tail_probability(self):
+        """Test log P(at least m adjacent nodes)"""
+        print("\n--- Testing Log Tail Probability ---")
+        
+        from scipy import special, stats
+        
+        cases = [(10, 3, 0.2), (100, 2, 0.05), (100, 30, 0.1), (300, 1, 0.001)]
+        log_tail = np.array([log_probability_at_least_m_adjacent(n, m, p) for n, m, p in cases])
+        expected = np.log([stats.binom.sf(m - 1, n - 1, p) for n, m, p in cases])
+        self.test("log P(X ≥ m) matches log binom.sf",
+                 np.allclose(log_tail, expected, rtol=1e-10, atol=1e-12),
+                 f"max |diff| = {np.max(np.abs(log_tail - expected)):.2e}")
+        
+        # P(X ≥ 50) for X ~ Bin(99, 1e-10) underflows to 0 in linear space;
+        # its k = m term dominates the tail (next term is ~p times smaller)
+        n, m, p = 100, 50, 1e-10
+        log_tail = log_probability_at_least_m_adjacent(n, m, p)
+        leading = (special.gammaln(n) - special.gammaln(m + 1) - special.gammaln(n - m)
+                   + m * np.log(p) + (n - 1 - m) * np.log1p(-p))
+        self.test("log P(X ≥ m) finite where P(X ≥ m) underflows",
+                 stats.binom.sf(m - 1, n - 1, p) == 0.0 and np.isclose(log_tail, leading, rtol=1e-12),
+                 f"log P = {log_tail:.4f}, leading term {leading:.4f}")
+        
+        # m at the top of the range: the logsumexp runs over only a few terms
+        cases = [(100, 95, 0.9), (100, 99, 0.5), (300, 290, 0.97)]
+        log_tail = np.array([log_probability_at_least_m_adjacent(n, m, p) for n, m, p in cases])
+        expected = np.log([stats.binom.sf(m - 1, n - 1, p) for n, m, p in cases])
+        self.test("log P(X ≥ m) matches log binom.sf for m near n",
+                 np.allclose(log_tail, expected, rtol=1e-10, atol=1e-12),
+                 f"max |diff| = {np.max(np.abs(log_tail - expected)):.2e}")
+    
     def test_network_robustness(self):
         """Test network robustness analyzer"""
         print("\n--- Testing Network Robustness Analyzer ---")
@@ -0,0 +1,44 @@
+"""
+utils/_compile.py
+
+Ahead-of-time build of the scalar binomial kernels used by utils/statistics.py,
+so short-lived scripts skip the Numba JIT warm-up on first call.
+
+Build (requires numba with numba.pycc):
+    python -m utils._compile
+
+This writes utils/_stats_native.*.so next to this file; statistics.py picks it
+up automatically and falls back to the @njit / pure-Python kernels without it,
+or when the kernels have changed since it was built (rebuild to refresh).
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from numba.pycc import CC
+
+from utils import statistics
+
+
+# Built from the pure-Python kernels, which statistics.py never rebinds (the
+# @njit names may already point at a previous native build)
+_KERNEL_HASH = statistics._kernel_hash()
+
+
+def kernel_hash():
+    return _KERNEL_HASH
+
+
+cc = CC('_stats_native')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export('binom_pmf', 'f8(f8, i8, i8, f8)')(statistics._binom_pmf_py)
+cc.export('binom_tail_sum', 'f8(f8, i8, i8, f8)')(statistics._binom_tail_sum_py)
+# statistics.py ignores a build whose hash no longer matches its kernels
+cc.export('kernel_hash', 'i8()')(kernel_hash)
+
+
+if __name__ == "__main__":
+    cc.compile()
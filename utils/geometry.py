@@ -1,142 +1,229 @@
 # Geometric utilities for UV network coverage calculations. Includes coordinate transformations and distance calculations.
 
+import math
 import numpy as np
-from typing import Tuple, List
+from typing import Tuple
+
+
+def deg_to_rad(degrees: float) -> float:
+    """Convert degrees to radians"""
+    return np.radians(degrees)
+
+
+def rad_to_deg(radians: float) -> float:
+    """Convert radians to degrees"""
+    return np.degrees(radians)
+
+
+def euclidean_distance_2d(x1: float, y1: float, x2: float, y2: float) -> float:
+    return np.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+
+
+def euclidean_distance_polar(r1: float, phi1: float, r2: float, phi2: float) -> float:
+    # Convert to Cartesian
+    x1, y1 = r1 * np.cos(phi1), r1 * np.sin(phi1)
+    x2, y2 = r2 * np.cos(phi2), r2 * np.sin(phi2)
+    return euclidean_distance_2d(x1, y1, x2, y2)
+
+
+def cartesian_to_polar(x: float, y: float) -> Tuple[float, float]:
+    r = np.sqrt(x**2 + y**2)
+    phi = np.arctan2(y, x)
+    return r, phi
+
+
+def polar_to_cartesian(r: float, phi: float) -> Tuple[float, float]:
+    x = r * np.cos(phi)
+    y = r * np.sin(phi)
+    return x, y
+
+
+def circle_area(radius: float) -> float:
+    """Calculate area of circle"""
+    return np.pi * radius**2
+
+
+def ellipse_area(semi_major: float, semi_minor: float) -> float:
+    """Calculate area of ellipse"""
+    return np.pi * semi_major * semi_minor
+
+
+def sector_area(radius: float, angle_rad: float) -> float:
+    return 0.5 * radius**2 * angle_rad
+
+
+def triangle_area(base: float, height: float) -> float:
+    """Calculate area of triangle"""
+    return 0.5 * base * height
+
+
+def is_point_in_circle(px: float, py: float, cx: float, cy: float, radius: float) -> bool:
+    distance = euclidean_distance_2d(px, py, cx, cy)
+    return distance <= radius
+
+
+def precompute_line(x1: float, y1: float,
+                    x2: float, y2: float) -> Tuple[float, float, float, float]:
+    """Line ax + by + c = 0 through both points, plus 1/sqrt(a²+b²) (0 if degenerate)"""
+    a = y2 - y1
+    b = x1 - x2
+    c = x2 * y1 - x1 * y2
+    norm_sq = a * a + b * b
+    inv_denom = 1.0 / math.sqrt(norm_sq) if norm_sq > 0 else 0.0
+    return a, b, c, inv_denom
+
+
+def point_to_line_distance_fast(px: float, py: float,
+                                line_params: Tuple[float, float, float, float]) -> float:
+    a, b, c, inv_denom = line_params
+    return abs(a * px + b * py + c) * inv_denom
+
+
+def point_to_line_distance_batch(px_arr: np.ndarray, py_arr: np.ndarray,
+                                 line_params: Tuple[float, float, float, float]) -> np.ndarray:
+    # Keeps the input precision, so float32 coverage grids stay float32
+    a, b, c, inv_denom = line_params
+    return np.abs(a * np.asarray(px_arr) + b * np.asarray(py_arr) + c) * inv_denom
+
+
+def point_to_line_distance(px: float, py: float, x1: float, y1: float, 
+                           x2: float, y2: float) -> float:
+    return point_to_line_distance_fast(px, py, precompute_line(x1, y1, x2, y2))
+
+
+def pairwise_sqdist(A: np.ndarray, B: np.ndarray, chunk_size: int = 65536) -> np.ndarray:
+    """
+    Squared distances between every row of A (N, 2) and B (M, 2) as an (N, M) array.
+    
+    Uses ||a||² + ||b||² - 2 a·b so the cross term is a single matrix product;
+    B is processed in chunks of chunk_size rows to bound temporary memory.
+    """
+    A = np.asarray(A, dtype=np.float64).reshape(-1, 2)
+    B = np.asarray(B, dtype=np.float64).reshape(-1, 2)
+    a2 = np.einsum('ij,ij->i', A, A)
+    out = np.empty((A.shape[0], B.shape[0]))
+    
+    for start in range(0, B.shape[0], chunk_size):
+        Bc = B[start:start + chunk_size]
+        b2 = np.einsum('ij,ij->i', Bc, Bc)
+        block = out[:, start:start + chunk_size]
+        np.matmul(A, Bc.T, out=block)
+        block *= -2.0
+        block += a2[:, None]
+        block += b2[None, :]
+    
+    # Guard against small negative values from cancellation
+    np.maximum(out, 0.0, out=out)
+    return out
+
+
+def points_in_circle_mask(centers: np.ndarray, points: np.ndarray, radius: float) -> np.ndarray:
+    """(N, M) mask of points strictly within radius of each center (no sqrt)"""
+    return pairwise_sqdist(centers, points) < radius * radius
+
+
+def rotate_point(x: float, y: float, angle_rad: float, 
+                cx: float = 0, cy: float = 0) -> Tuple[float, float]:
+    # Translate to origin
+    x_trans = x - cx
+    y_trans = y - cy
+    
+    # Rotate
+    x_rot = x_trans * np.cos(angle_rad) - y_trans * np.sin(angle_rad)
+    y_rot = x_trans * np.sin(angle_rad) + y_trans * np.cos(angle_rad)
+    
+    # Translate back
+    x_rot += cx
+    y_rot += cy
+    
+    return x_rot, y_rot
+
+
+def calculate_angle_between_vectors(x1: float, y1: float, 
+                                   x2: float, y2: float) -> float:
+    # atan2(|a×b|, a·b) is exact for near-parallel vectors, no clip needed
+    cross = x1 * y2 - y1 * x2
+    dot = x1 * x2 + y1 * y2
+    
+    if cross == 0 and dot == 0:
+        return 0
+    
+    return math.atan2(abs(cross), dot)
+
+
+def grid_points(x_min: float, x_max: float, y_min: float, y_max: float,
+               nx: int, ny: int, sparse: bool = False,
+               dtype: np.dtype = np.float32) -> Tuple[np.ndarray, np.ndarray]:
+    # Dense (ny, nx) arrays by default; sparse=True returns shapes (1, nx)
+    # and (ny, 1), which broadcast to the full grid on demand.
+    # float32 is ample for coverage grids; pass dtype=np.float64 if needed.
+    x = np.linspace(x_min, x_max, nx, dtype=dtype)
+    y = np.linspace(y_min, y_max, ny, dtype=dtype)
+    X, Y = np.meshgrid(x, y, sparse=sparse)
+    return X, Y
+
+
+def generate_square_network_positions(n: int, side_length: float,
+                                      legacy_tuples: bool = False) -> np.ndarray:
+    """
+    Grid positions for n nodes, filled column by column.
+    
+    Returns an (n, 2) float64 array of (x, y) rows; use to_xy() for the
+    contiguous per-axis form consumed by batched/vectorized helpers.
+    Pass legacy_tuples=True for the old List[Tuple[float, float]] result.
+    """
+    # Calculate grid dimensions
+    grid_size = int(np.ceil(np.sqrt(n)))
+    spacing = side_length / (grid_size - 1) if grid_size > 1 else 0
+    
+    idx = np.arange(n)
+    positions = np.empty((n, 2), dtype=np.float64)
+    positions[:, 0] = (idx // grid_size) * spacing
+    positions[:, 1] = (idx % grid_size) * spacing
+    
+    if legacy_tuples:
+        return [tuple(p) for p in positions.tolist()]
+    return positions
+
+
+def to_xy(positions) -> Tuple[np.ndarray, np.ndarray]:
+    """Split (n, 2) positions (array or list of tuples) into contiguous xs, ys"""
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+    return np.ascontiguousarray(positions[:, 0]), np.ascontiguousarray(positions[:, 1])
+
 
 class GeometryUtils:
-    """Geometric calculation utilities"""
-    
-    @staticmethod
-    def deg_to_rad(degrees: float) -> float:
-        """Convert degrees to radians"""
-        return np.radians(degrees)
-    
-    @staticmethod
-    def rad_to_deg(radians: float) -> float:
-        """Convert radians to degrees"""
-        return np.degrees(radians)
-    
-    @staticmethod
-    def euclidean_distance_2d(x1: float, y1: float, x2: float, y2: float) -> float:
-        return np.sqrt((x2 - x1)**2 + (y2 - y1)**2)
-    
-    @staticmethod
-    def euclidean_distance_polar(r1: float, phi1: float, r2: float, phi2: float) -> float:
-        # Convert to Cartesian
-        x1, y1 = r1 * np.cos(phi1), r1 * np.sin(phi1)
-        x2, y2 = r2 * np.cos(phi2), r2 * np.sin(phi2)
-        return GeometryUtils.euclidean_distance_2d(x1, y1, x2, y2)
-    
-    @staticmethod
-    def cartesian_to_polar(x: float, y: float) -> Tuple[float, float]:
-        r = np.sqrt(x**2 + y**2)
-        phi = np.arctan2(y, x)
-        return r, phi
-    
-    @staticmethod
-    def polar_to_cartesian(r: float, phi: float) -> Tuple[float, float]:
-        x = r * np.cos(phi)
-        y = r * np.sin(phi)
-        return x, y
-    
-    @staticmethod
-    def circle_area(radius: float) -> float:
-        """Calculate area of circle"""
-        return np.pi * radius**2
-    
-    @staticmethod
-    def ellipse_area(semi_major: float, semi_minor: float) -> float:
-        """Calculate area of ellipse"""
-        return np.pi * semi_major * semi_minor
-    
-    @staticmethod
-    def sector_area(radius: float, angle_rad: float) -> float:
-        return 0.5 * radius**2 * angle_rad
-    
-    @staticmethod
-    def triangle_area(base: float, height: float) -> float:
-        """Calculate area of triangle"""
-        return 0.5 * base * height
-    
-    @staticmethod
-    def is_point_in_circle(px: float, py: float, cx: float, cy: float, radius: float) -> bool:
-        distance = GeometryUtils.euclidean_distance_2d(px, py, cx, cy)
-        return distance <= radius
-    
-    @staticmethod
-    def point_to_line_distance(px: float, py: float, x1: float, y1: float, 
-                               x2: float, y2: float) -> float:
-        # Line equation: ax + by + c = 0
-        a = y2 - y1
-        b = x1 - x2
-        c = x2 * y1 - x1 * y2
-        
-        # Distance formula
-        numerator = abs(a * px + b * py + c)
-        denominator = np.sqrt(a**2 + b**2)
-        
-        return numerator / denominator if denominator > 0 else 0
-    
-    @staticmethod
-    def rotate_point(x: float, y: float, angle_rad: float, 
-                    cx: float = 0, cy: float = 0) -> Tuple[float, float]:
-        # Translate to origin
-        x_trans = x - cx
-        y_trans = y - cy
-        
-        # Rotate
-        x_rot = x_trans * np.cos(angle_rad) - y_trans * np.sin(angle_rad)
-        y_rot = x_trans * np.sin(angle_rad) + y_trans * np.cos(angle_rad)
-        
-        # Translate back
-        x_rot += cx
-        y_rot += cy
-        
-        return x_rot, y_rot
-    
-    @staticmethod
-    def calculate_angle_between_vectors(x1: float, y1: float, 
-                                       x2: float, y2: float) -> float:
-        dot_product = x1 * x2 + y1 * y2
-        mag1 = np.sqrt(x1**2 + y1**2)
-        mag2 = np.sqrt(x2**2 + y2**2)
-        
-        if mag1 == 0 or mag2 == 0:
-            return 0
-        
-        cos_angle = dot_product / (mag1 * mag2)
-        cos_angle = np.clip(cos_angle, -1, 1)  # Handle numerical errors
-        
-        return np.arccos(cos_angle)
-    
-    @staticmethod
-    def grid_points(x_min: float, x_max: float, y_min: float, y_max: float,
-                   nx: int, ny: int) -> Tuple[np.ndarray, np.ndarray]:
-        x = np.linspace(x_min, x_max, nx)
-        y = np.linspace(y_min, y_max, ny)
-        X, Y = np.meshgrid(x, y)
-        return X, Y
-    
-    @staticmethod
-    def generate_square_network_positions(n: int, side_length: float) -> List[Tuple[float, float]]:
-        # Calculate grid dimensions
-        grid_size = int(np.ceil(np.sqrt(n)))
-        spacing = side_length / (grid_size - 1) if grid_size > 1 else 0
-        
-        positions = []
-        for i in range(grid_size):
-            for j in range(grid_size):
-                if len(positions) < n:
-                    x = i * spacing
-                    y = j * spacing
-                    positions.append((x, y))
-        
-        return positions[:n]
+    """Geometric calculation utilities (delegates to the module-level functions)"""
+    
+    deg_to_rad = staticmethod(deg_to_rad)
+    rad_to_deg = staticmethod(rad_to_deg)
+    euclidean_distance_2d = staticmethod(euclidean_distance_2d)
+    euclidean_distance_polar = staticmethod(euclidean_distance_polar)
+    cartesian_to_polar = staticmethod(cartesian_to_polar)
+    polar_to_cartesian = staticmethod(polar_to_cartesian)
+    circle_area = staticmethod(circle_area)
+    ellipse_area = staticmethod(ellipse_area)
+    sector_area = staticmethod(sector_area)
+    triangle_area = staticmethod(triangle_area)
+    is_point_in_circle = staticmethod(is_point_in_circle)
+    point_to_line_distance = staticmethod(point_to_line_distance)
+    precompute_line = staticmethod(precompute_line)
+    point_to_line_distance_fast = staticmethod(point_to_line_distance_fast)
+    point_to_line_distance_batch = staticmethod(point_to_line_distance_batch)
+    pairwise_sqdist = staticmethod(pairwise_sqdist)
+    points_in_circle_mask = staticmethod(points_in_circle_mask)
+    rotate_point = staticmethod(rotate_point)
+    calculate_angle_between_vectors = staticmethod(calculate_angle_between_vectors)
+    grid_points = staticmethod(grid_points)
+    generate_square_network_positions = staticmethod(generate_square_network_positions)
+    to_xy = staticmethod(to_xy)
 
 
 class CoordinateSystem:
     """Coordinate system handler for UV network"""
     
+    __slots__ = ('origin',)
+    
     def __init__(self, origin: Tuple[float, float] = (0, 0)):
         self.origin = origin
     
@@ -174,5 +261,5 @@ if __name__ == "__main__":
     # Test network generation
     positions = GeometryUtils.generate_square_network_positions(4, 300)
     print(f"\n4-node square network positions (side=300m):")
-    for i, pos in enumerate(positions):
-        print(f"  Node {i+1}: {pos}")
\ No newline at end of file
+    for i, (x, y) in enumerate(positions):
+        print(f"  Node {i+1}: ({x}, {y})")
\ No newline at end of file
@@ -7,15 +7,143 @@ Used for connectivity analysis (Section III-C) and coverage integrals.
 
 import numpy as np
 from scipy import integrate
+from functools import lru_cache
 from typing import Callable, Tuple, Optional
 
+
+@lru_cache(maxsize=128)
+def _sample_points(a: float, b: float, n_points: int) -> np.ndarray:
+    """Cached, read-only linspace shared by repeated fixed-rule integrations"""
+    x = np.linspace(a, b, n_points)
+    x.flags.writeable = False
+    return x
+
+
+def _evaluate_on_grid(func: Callable, *grids: np.ndarray, dtype=np.float64) -> np.ndarray:
+    """Evaluate func on the grids in one vectorized call, falling back to element-wise"""
+    shape = np.broadcast_shapes(*(g.shape for g in grids))
+    try:
+        y = np.asarray(func(*grids), dtype=dtype)
+        if y.shape == shape:
+            return y
+    except (TypeError, ValueError):
+        pass
+    return np.frompyfunc(func, len(grids), 1)(*grids).astype(dtype)
+
+
+# Quadrature used by the region integrators: 'dblquad' (adaptive) or 'gl'
+_DEFAULT_QUADRATURE = {'method': 'dblquad', 'order': 48}
+
+
+@lru_cache(maxsize=64)
+def _gl_nodes_weights(order: int, a: float, b: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Gauss-Legendre nodes and weights mapped onto [a, b]"""
+    nodes, weights = np.polynomial.legendre.leggauss(order)
+    half = 0.5 * (b - a)
+    nodes = half * nodes + 0.5 * (a + b)
+    weights = half * weights
+    nodes.flags.writeable = False
+    weights.flags.writeable = False
+    return nodes, weights
+
+
+def _gl_dblquad(func: Callable, a: float, b: float,
+                gfun: Callable, hfun: Callable, order: int) -> float:
+    """Tensor Gauss-Legendre rule with the same calling convention as dblquad"""
+    x, wx = _gl_nodes_weights(order, float(a), float(b))
+    t, wt = _gl_nodes_weights(order, -1.0, 1.0)
+    
+    # Inner limits depend on x, so only the reference rule is mapped per node
+    lo = np.array([gfun(xi) for xi in x], dtype=np.float64)
+    hi = np.array([hfun(xi) for xi in x], dtype=np.float64)
+    half = 0.5 * (hi - lo)
+    Y = (0.5 * (hi + lo))[:, None] + half[:, None] * t[None, :]
+    X = np.broadcast_to(x[:, None], Y.shape)
+    
+    F = _evaluate_on_grid(func, Y, X)
+    return float(np.sum(wx * half * (F @ wt)))
+
+
+def _dblquad(func: Callable, a: float, b: float,
+             gfun: Callable, hfun: Callable, **kwargs) -> Tuple[float, float]:
+    """Route a dblquad-style call through the configured default quadrature"""
+    if _DEFAULT_QUADRATURE['method'] == 'gl':
+        return _gl_dblquad(func, a, b, gfun, hfun, _DEFAULT_QUADRATURE['order']), 0.0
+    return integrate.dblquad(func, a, b, gfun, hfun, **kwargs)
+
+
 class IntegrationUtils:
     """Numerical integration utilities"""
     
+    @staticmethod
+    def set_default_quadrature(method: str = 'dblquad', order: int = 48) -> None:
+        """
+        Select the rule used by the polar, circular, elliptical and
+        connectivity integrators.
+        
+        Args:
+            method: 'dblquad' (adaptive, with error estimate) or 'gl'
+                    (cached fixed-order Gauss-Legendre, error reported as 0)
+            order: Number of Gauss-Legendre nodes per dimension
+        """
+        if method not in ('dblquad', 'gl'):
+            raise ValueError(f"Unknown integration method: {method}")
+        if order < 1:
+            raise ValueError("Quadrature order must be positive")
+        _DEFAULT_QUADRATURE['method'] = method
+        _DEFAULT_QUADRATURE['order'] = int(order)
+    
     @staticmethod
     def integrate_1d(func: Callable, a: float, b: float, method: str = 'quad', **kwargs) -> Tuple[float, float]:
+        if method == 'quad':
+            # Adaptive quadrature (default scipy method)
+            result, error = integrate.quad(func, a, b, **kwargs)
+            return result, error
+        
+        elif method == 'trapz':
+            # Trapezoidal rule
+            n_points = kwargs.get('n_points', 1000)
+            x = _sample_points(a, b, n_points)
+            y = _evaluate_on_grid(func, x)
+            result = integrate.trapezoid(y, x)
+            return result, 0.0  # No error estimate
+        
+        elif method == 'simps':
+            # Simpson's rule
+            n_points = kwargs.get('n_points', 1001)  # Must be odd
+            if n_points % 2 == 0:
+                n_points += 1
+            x = _sample_points(a, b, n_points)
+            y = _evaluate_on_grid(func, x)
+            result = integrate.simpson(y, x=x)
+            return result, 0.0  # No error estimate
+        
+        else:
+            raise ValueError(f"Unknown integration method: {method}")
+    
+    @staticmethod
+    def integrate_2d(func: Callable, 
+                    x_bounds: Tuple[float, float],
+                    y_bounds: Tuple[float, float],
+                    method: str = 'dblquad',
+                    **kwargs) -> Tuple[float, float]:
+        """
+        Numerical integration in 2D
+        
+        Args:
+            func: Function to integrate f(y, x) - note order!
+            x_bounds: (x_min, x_max) integration bounds
+            y_bounds: (y_min, y_max) integration bounds
+            method: Integration method ('dblquad', 'grid')
+            **kwargs: Additional arguments; 'grid' accepts nx, ny and
+                      dtype (default float32, ample for coverage estimates)
+            
+        Returns:
+            (result, error): Integration result and error estimate
+        """
         if method == 'dblquad':
-            # Double integration using scipy
+            # Always adaptive: set_default_quadrature only applies to the
+            # region integrators, so an explicit 'dblquad' stays dblquad
             x_min, x_max = x_bounds
             y_min, y_max = y_bounds
             result, error = integrate.dblquad(func, x_min, x_max, 
@@ -27,20 +155,18 @@ class IntegrationUtils:
             # Grid-based integration (for complex boundaries)
             nx = kwargs.get('nx', 100)
             ny = kwargs.get('ny', 100)
-            x = np.linspace(x_bounds[0], x_bounds[1], nx)
-            y = np.linspace(y_bounds[0], y_bounds[1], ny)
-            X, Y = np.meshgrid(x, y)
+            dtype = kwargs.get('dtype', np.float32)
+            x = np.linspace(x_bounds[0], x_bounds[1], nx, dtype=dtype)
+            y = np.linspace(y_bounds[0], y_bounds[1], ny, dtype=dtype)
+            X, Y = np.meshgrid(x, y, sparse=True)
             
             # Evaluate function on grid
-            Z = np.zeros_like(X)
-            for i in range(ny):
-                for j in range(nx):
-                    Z[i, j] = func(Y[i, j], X[i, j])
+            Z = _evaluate_on_grid(func, Y, X, dtype=dtype)
             
-            # Trapezoidal integration
+            # Trapezoidal integration (accumulate in float64)
             dx = (x_bounds[1] - x_bounds[0]) / (nx - 1)
             dy = (y_bounds[1] - y_bounds[0]) / (ny - 1)
-            result = np.sum(Z) * dx * dy
+            result = float(np.sum(Z, dtype=np.float64)) * dx * dy
             
             return result, 0.0
         
@@ -59,7 +185,7 @@ class IntegrationUtils:
         r_min, r_max = r_bounds
         phi_min, phi_max = phi_bounds
         
-        result, error = integrate.dblquad(
+        result, error = _dblquad(
             integrand_cartesian,
             r_min, r_max,
             lambda r: phi_min,
@@ -81,7 +207,7 @@ class IntegrationUtils:
             y = cy + r * np.sin(phi)
             return func(x, y) * r  # Include Jacobian
         
-        result, error = integrate.dblquad(
+        result, error = _dblquad(
             func_polar,
             0, radius,
             lambda r: 0,
@@ -100,26 +226,32 @@ class IntegrationUtils:
                                    **kwargs) -> Tuple[float, float]:
         cx, cy = center
         
+        # Rotation and Jacobian factors are fixed for the whole region
+        cos_rot = np.cos(rotation)
+        sin_rot = np.sin(rotation)
+        ab = semi_major * semi_minor
+        
         def func_parametric(theta, r):
             # Parametric ellipse: x = a*r*cos(θ), y = b*r*sin(θ)
             x_local = semi_major * r * np.cos(theta)
             y_local = semi_minor * r * np.sin(theta)
             
-            # Apply rotation
-            x_rot = x_local * np.cos(rotation) - y_local * np.sin(rotation)
-            y_rot = x_local * np.sin(rotation) + y_local * np.cos(rotation)
-            
-            # Translate to center
-            x = cx + x_rot
-            y = cy + y_rot
+            # Apply rotation, then translate to center
+            x = cx + x_local * cos_rot - y_local * sin_rot
+            y = cy + x_local * sin_rot + y_local * cos_rot
             
             # Jacobian for elliptical coordinates
-            jacobian = semi_major * semi_minor * r
-            
-            return func(x, y) * jacobian
+            return func(x, y) * (ab * r)
+        
+        def func_parametric_axis_aligned(theta, r):
+            x = cx + semi_major * r * np.cos(theta)
+            y = cy + semi_minor * r * np.sin(theta)
+            return func(x, y) * (ab * r)
         
-        result, error = integrate.dblquad(
-            func_parametric,
+        integrand = func_parametric if rotation else func_parametric_axis_aligned
+        
+        result, error = _dblquad(
+            integrand,
             0, 1,  # r from 0 to 1 (normalized)
             lambda r: 0,
             lambda r: 2 * np.pi,
@@ -162,6 +294,13 @@ class ConnectivityIntegrator:
             phi_1 = phi1_bound(tx, phi_x, l)
             phi_2 = phi2_bound(tx, phi_x, l)
             
+            # Skip dblquad when the t-range is empty across [phi_1, phi_2]:
+            # the discriminant tx²cos²(φ - φx) - (tx² - l²) must be positive somewhere
+            phi_samples = np.linspace(phi_1, phi_2, 8)
+            disc = (tx * np.cos(phi_samples - phi_x))**2 - (tx**2 - l**2)
+            if l <= 0 or phi_2 <= phi_1 or np.all(disc <= 0):
+                return 0.0
+            
             def integrand(phi, t):
                 x = t * np.cos(phi)
                 y = t * np.sin(phi)
@@ -205,7 +344,7 @@ class ConnectivityIntegrator:
         
         # Perform integration
         try:
-            result, _ = integrate.dblquad(
+            result, _ = _dblquad(
                 integrand,
                 phi_1, phi_2,
                 t1_bound, t2_bound,
@@ -213,7 +352,7 @@ class ConnectivityIntegrator:
                 epsrel=kwargs.get('epsrel', 1e-6)
             )
             return result
-        except:
+        except (ValueError, RuntimeError):
             return 0.0
 
 
@@ -254,49 +393,3 @@ if __name__ == "__main__":
         f_circle, (0, 0), 1
     )
     print(f"\nCircular area integration = {result:.6f} (expected: {np.pi:.6f})")
-
-    if method == 'quad':
-            # Adaptive quadrature (default scipy method)
-            result, error = integrate.quad(func, a, b, **kwargs)
-            return result, error
-        
-    elif method == 'trapz':
-            # Trapezoidal rule
-            n_points = kwargs.get('n_points', 1000)
-            x = np.linspace(a, b, n_points)
-            y = np.array([func(xi) for xi in x])
-            result = np.trapz(y, x)
-            return result, 0.0  # No error estimate
-        
-    elif method == 'simps':
-            # Simpson's rule
-            n_points = kwargs.get('n_points', 1001)  # Must be odd
-            if n_points % 2 == 0:
-                n_points += 1
-            x = np.linspace(a, b, n_points)
-            y = np.array([func(xi) for xi in x])
-            result = integrate.simps(y, x)
-            return result, 0.0  # No error estimate
-        
-    else:
-            raise ValueError(f"Unknown integration method: {method}")
-    
-    @staticmethod
-    def integrate_2d(func: Callable, 
-                    x_bounds: Tuple[float, float],
-                    y_bounds: Tuple[float, float],
-                    method: str = 'dblquad',
-                    **kwargs) -> Tuple[float, float]:
-        """
-        Numerical integration in 2D
-        
-        Args:
-            func: Function to integrate f(y, x) - note order!
-            x_bounds: (x_min, x_max) integration bounds
-            y_bounds: (y_min, y_max) integration bounds
-            method: Integration method ('dblquad', 'grid')
-            **kwargs: Additional arguments
-            
-        Returns:
-            (result, error): Integration result and error estimate
-        """
\ No newline at end of file
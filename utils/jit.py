@@ -0,0 +1,28 @@
+"""
+utils/jit.py
+
+Optional Numba acceleration for scalar numerical kernels.
+numba is not a hard dependency: when it is missing, njit() returns the
+undecorated Python function so every kernel still runs unchanged, and
+prange is plain range.
+"""
+
+try:
+    from numba import njit as _numba_njit
+    from numba import prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    _numba_njit = None
+    prange = range
+    NUMBA_AVAILABLE = False
+
+
+def njit(*args, **kwargs):
+    """numba.njit when available, otherwise a no-op decorator"""
+    if NUMBA_AVAILABLE:
+        return _numba_njit(*args, **kwargs)
+
+    # Bare @njit usage
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda func: func
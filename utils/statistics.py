@@ -1,109 +1,276 @@
 #Statistical utilities for UV network analysis. Includes binomial distribution for connectivity (Equation 23).
 import numpy as np
-from scipy import stats
-from scipy.special import comb
+import sys
+import os
+import hashlib
+from scipy import optimize, special
+from scipy.stats import qmc
+from functools import lru_cache
+from math import exp, lgamma, log, log1p
 from typing import List, Tuple
 
-class StatisticsUtils:
-    """Statistical calculation utilities"""
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from utils.jit import njit
+
+
+@lru_cache(maxsize=4096)
+def _log_binom_coeff(n: int, k: int) -> float:
+    """log C(n, k); depends only on (n, k), so it is shared across every p"""
+    return lgamma(n + 1.0) - lgamma(k + 1.0) - lgamma(n - k + 1.0)
+
+
+def _binom_pmf_py(log_coeff, n, k, p):
+    """Binomial PMF in log space (no overflow for large n); assumes 0 <= k <= n"""
+    if p == 0.0:
+        return 1.0 if k == 0 else 0.0
+    if p == 1.0:
+        return 1.0 if k == n else 0.0
+    return exp(log_coeff + k * log(p) + (n - k) * log1p(-p))
+
+
+def _binom_tail_sum_py(start_pmf, n, k, p):
+    """
+    Sum PMF terms from k (at or above the mode) upward using
+    PMF(s+1) = PMF(s) * (n-s)/(s+1) * p/(1-p); stops once terms are negligible.
+    """
+    ratio = p / (1.0 - p)
+    term = start_pmf
+    total = 0.0
+    while k <= n:
+        total += term
+        if term <= 1e-17 * total:
+            break
+        term *= (n - k) / (k + 1.0) * ratio
+        k += 1
+    return total
+
+
+_binom_pmf_scalar = njit(cache=True)(_binom_pmf_py)
+_binom_tail_sum = njit(cache=True)(_binom_tail_sum_py)
+
+
+def _kernel_hash() -> int:
+    """Fingerprint of the pure-Python kernels, baked into the AOT build"""
+    digest = hashlib.sha1()
+    for func in (_binom_pmf_py, _binom_tail_sum_py):
+        digest.update(func.__code__.co_code)
+        digest.update(repr(func.__code__.co_consts).encode())
+    # Fits in a signed 64-bit integer
+    return int(digest.hexdigest()[:15], 16)
+
+
+# Prefer the ahead-of-time build from utils/_compile.py (no JIT warm-up),
+# unless it was built from older kernels than the ones above
+try:
+    from utils import _stats_native
+except ImportError:
+    _stats_native = None
+
+if _stats_native is not None and _stats_native.kernel_hash() == _kernel_hash():
+    _binom_pmf_scalar = _stats_native.binom_pmf
+    _binom_tail_sum = _stats_native.binom_tail_sum
+
+
+@lru_cache(maxsize=4096)
+def _binomial_pmf_cached(n: int, k: int, p: float) -> float:
+    return _binom_pmf_scalar(_log_binom_coeff(n, k), n, k, p)
+
+
+def _tail_at_least_m(trials: int, m: int, p: float, log_coeff: float) -> float:
+    """P(X >= m) for X ~ Bin(trials, p), 1 <= m <= trials; log_coeff = log C(trials, m)"""
+    if p == 0.0 or p == 1.0:
+        return float(p)
     
-    @staticmethod
-    def binomial_pmf(n: int, k: int, p: float) -> float:
-        if p < 0 or p > 1:
-            raise ValueError("Probability must be in [0, 1]")
-        if k > n or k < 0:
-            return 0.0
-        # New fix
-        return stats.binom.pmf(k, np.float64(n), p)
-        # return stats.binom.pmf(k, np.int_(n), p) # <--- MODIFIED LINE
-        # return stats.binom.pmf(k, n, p)
+    # Above the mean the upper tail is a short, fast-decaying sum; otherwise
+    # use P(X >= m) = I_p(m, trials - m + 1) directly rather than 1 - P(X <= m - 1)
+    if m > trials * p:
+        return _binom_tail_sum(_binom_pmf_scalar(log_coeff, trials, m, p), trials, m, p)
+    return float(special.betainc(m, trials - m + 1, p))
+
+
+@lru_cache(maxsize=4096)
+def _probability_at_least_m_cached(n: int, m: int, p: float) -> float:
+    # X ~ Bin(n - 1, p); assumes 1 <= m <= n - 1
+    return _tail_at_least_m(n - 1, m, p, _log_binom_coeff(n - 1, m))
+
+
+def binomial_pmf(n: int, k: int, p: float) -> float:
+    if p < 0 or p > 1:
+        raise ValueError("Probability must be in [0, 1]")
+    if k > n or k < 0:
+        return 0.0
     
-    @staticmethod
-    def binomial_cdf(n: int, k: int, p: float) -> float:
-        if p < 0 or p > 1:
-            raise ValueError("Probability must be in [0, 1]")
-        
-        return stats.binom.cdf(k, n, p)
+    # Boundary cases (hit by the p = 0 / p = 1 bracket ends) need no log-space work
+    if p == 0:
+        return 1.0 if k == 0 else 0.0
+    if p == 1:
+        return 1.0 if k == n else 0.0
+    if k == 0:
+        return (1 - p) ** n
+    if k == n:
+        return p ** n
+    # Keyed on the exact p: rounding the key would also round the result,
+    # which destroys small-p tails
+    return _binomial_pmf_cached(n, k, float(p))
+
+
+def binomial_cdf(n: int, k: int, p: float) -> float:
+    if p < 0 or p > 1:
+        raise ValueError("Probability must be in [0, 1]")
     
-    @staticmethod
-    def binomial_survival(n: int, k: int, p: float) -> float:
-        return stats.binom.sf(k, n, p)
+    if k < 0:
+        return 0.0
+    if k >= n:
+        return 1.0
+    # P(X <= k) = I_{1-p}(n - k, k + 1)
+    return float(special.betainc(n - k, k + 1, 1 - p))
+
+
+def binomial_survival(n: int, k: int, p: float) -> float:
+    if k < 0:
+        return 1.0
+    if k >= n:
+        return 0.0
+    # P(X > k) = I_p(k + 1, n - k)
+    return float(special.betainc(k + 1, n - k, p))
+
+
+def probability_m_adjacent(n: int, m: int, p: float) -> float:
+    if m >= n:
+        return 0.0
     
-    @staticmethod
-    def probability_m_adjacent(n: int, m: int, p: float) -> float:
-        if m >= n:
-            return 0.0
-        
-        return StatisticsUtils.binomial_pmf(n - 1, m, p)
+    return binomial_pmf(n - 1, m, p)
+
+
+def probability_at_least_m_adjacent(n: int, m: int, p: float) -> float:
+    if m >= n:
+        return 0.0
+    if m <= 0:
+        return 1.0
+    if p < 0 or p > 1:
+        raise ValueError("Probability must be in [0, 1]")
     
-    @staticmethod
-    def probability_at_least_m_adjacent(n: int, m: int, p: float) -> float:
-        if m >= n:
-            return 0.0
-        if m <= 0:
-            return 1.0
-        
-        # Calculate sum of probabilities for 0 to m-1 adjacent nodes
-        sum_prob = sum(StatisticsUtils.binomial_pmf(n - 1, s, p) 
-                      for s in range(m))
-        
-        return 1.0 - sum_prob
+    return _probability_at_least_m_cached(n, m, float(p))
+
+
+def log_probability_at_least_m_adjacent(n: int, m: int, p: float) -> float:
+    """
+    log P(X >= m) for X ~ Bin(n - 1, p), accumulated with logsumexp over the
+    upper-tail log-PMFs. Stays finite where the probability itself
+    underflows (very small p or m far above the mean).
+    """
+    if m >= n:
+        return -np.inf
+    if m <= 0:
+        return 0.0
+    if p < 0 or p > 1:
+        raise ValueError("Probability must be in [0, 1]")
+    if p == 0:
+        return -np.inf
     
-    @staticmethod
-    def m_connectivity_probability(n: int, m: int, Q_n_m: float) -> float:
-        if Q_n_m < 0 or Q_n_m > 1:
-            Q_n_m = np.clip(Q_n_m, 0, 1)
-        
-        return Q_n_m ** n
+    trials = n - 1
+    ks = np.arange(m, trials + 1)
+    log_pmfs = (special.gammaln(trials + 1) - special.gammaln(ks + 1)
+                - special.gammaln(trials - ks + 1)
+                + special.xlogy(ks, p) + special.xlog1py(trials - ks, -p))
+    return float(min(special.logsumexp(log_pmfs), 0.0))
+
+
+def m_connectivity_probability(n: int, m: int, Q_n_m: float) -> float:
+    # Plain comparisons: the scalar hot path never needs a NumPy ufunc
+    if Q_n_m < 0:
+        Q_n_m = 0.0
+    elif Q_n_m > 1:
+        Q_n_m = 1.0
     
-    @staticmethod
-    def uniform_pdf_square(x: float, y: float, n: int, area: float) -> float:
-        return n / area if area > 0 else 0
+    return Q_n_m ** n
+
+
+def m_connectivity_probability_batch(n: int, Q_arr: np.ndarray) -> np.ndarray:
+    return np.power(np.clip(Q_arr, 0, 1), n)
+
+
+def uniform_pdf_square(x: float, y: float, n: int, area: float) -> float:
+    return n / area if area > 0 else 0
+
+
+def mean_and_std(data: List[float]) -> Tuple[float, float]:
+    """Calculate mean and standard deviation"""
+    # asarray avoids copying ndarray input; std reuses the computed mean
+    data_array = np.asarray(data, dtype=np.float64).ravel()
+    mean = data_array.mean()
+    dev = data_array - mean
+    return mean, np.sqrt(np.dot(dev, dev) / dev.size)
+
+
+def confidence_interval(data: List[float], confidence: float = 0.95) -> Tuple[float, float, float]:
+    data_array = np.asarray(data, dtype=np.float64)
+    n = data_array.size
+    mean = data_array.mean()
+    se = data_array.std(ddof=1) / np.sqrt(n)
     
-    @staticmethod
-    def mean_and_std(data: List[float]) -> Tuple[float, float]:
-        """Calculate mean and standard deviation"""
-        data_array = np.array(data)
-        return np.mean(data_array), np.std(data_array)
+    # t-distribution for small samples
+    h = se * special.stdtrit(n - 1, (1 + confidence) / 2)
     
-    @staticmethod
-    def confidence_interval(data: List[float], confidence: float = 0.95) -> Tuple[float, float, float]:
-        data_array = np.array(data)
-        n = len(data_array)
-        mean = np.mean(data_array)
-        se = stats.sem(data_array)
-        
-        # t-distribution for small samples
-        h = se * stats.t.ppf((1 + confidence) / 2, n - 1)
-        
-        return mean, mean - h, mean + h
+    return mean, mean - h, mean + h
+
+
+def monte_carlo_estimate(func: callable, n_samples: int, 
+                        bounds: List[Tuple[float, float]],
+                        seed: int = None, method: str = 'sobol') -> Tuple[float, float]:
+    # 'sobol' (scrambled quasi-random, ~1/n convergence for smooth integrands;
+    # the reported std_error is then a conservative bound) or 'random'
+    n_dims = len(bounds)
+    lows = np.array([low for low, _ in bounds], dtype=np.float64)
+    highs = np.array([high for _, high in bounds], dtype=np.float64)
     
-    @staticmethod
-    def monte_carlo_estimate(func: callable, n_samples: int, 
-                            bounds: List[Tuple[float, float]]) -> Tuple[float, float]:
-        n_dims = len(bounds)
-        
-        # Generate random samples
-        samples = []
-        for low, high in bounds:
-            samples.append(np.random.uniform(low, high, n_samples))
-        
-        # Evaluate function at sample points
-        values = []
-        for i in range(n_samples):
-            point = tuple(samples[j][i] for j in range(n_dims))
-            values.append(func(*point))
-        
-        values = np.array(values)
-        
-        # Calculate volume
-        volume = np.prod([high - low for low, high in bounds])
-        
-        # Estimate integral
-        estimate = volume * np.mean(values)
-        std_error = volume * np.std(values) / np.sqrt(n_samples)
-        
-        return estimate, std_error
+    # Generate samples, one row per dimension
+    if method == 'sobol':
+        engine = qmc.Sobol(d=n_dims, scramble=True, seed=seed)
+        # Leading points of the base-2 block, same as engine.random(n_samples)
+        # but without the non-power-of-two balance warning
+        unit = engine.random_base2(int(np.ceil(np.log2(max(n_samples, 1)))))[:n_samples]
+    elif method == 'random':
+        unit = np.random.default_rng(seed).random((n_samples, n_dims))
+    else:
+        raise ValueError(f"Unknown sampling method: {method}")
+    samples = (lows + unit * (highs - lows)).T
+    
+    # Evaluate function at all sample points in one call when it is array-safe
+    try:
+        values = np.asarray(func(*samples), dtype=np.float64)
+    except (TypeError, ValueError):
+        values = None
+    if values is None or values.shape != (n_samples,):
+        values = np.fromiter((func(*samples[:, i]) for i in range(n_samples)),
+                             dtype=np.float64, count=n_samples)
+    
+    # Calculate volume
+    volume = np.prod(highs - lows)
+    
+    # Estimate integral
+    estimate = volume * np.mean(values)
+    std_error = volume * np.std(values) / np.sqrt(n_samples)
+    
+    return estimate, std_error
+
+
+class StatisticsUtils:
+    """Statistical calculation utilities (delegates to the module-level functions)"""
+    
+    binomial_pmf = staticmethod(binomial_pmf)
+    binomial_cdf = staticmethod(binomial_cdf)
+    binomial_survival = staticmethod(binomial_survival)
+    probability_m_adjacent = staticmethod(probability_m_adjacent)
+    probability_at_least_m_adjacent = staticmethod(probability_at_least_m_adjacent)
+    log_probability_at_least_m_adjacent = staticmethod(log_probability_at_least_m_adjacent)
+    m_connectivity_probability = staticmethod(m_connectivity_probability)
+    m_connectivity_probability_batch = staticmethod(m_connectivity_probability_batch)
+    uniform_pdf_square = staticmethod(uniform_pdf_square)
+    mean_and_std = staticmethod(mean_and_std)
+    confidence_interval = staticmethod(confidence_interval)
+    monte_carlo_estimate = staticmethod(monte_carlo_estimate)
 
 
 class ConnectivityStatistics:
@@ -112,32 +279,79 @@ class ConnectivityStatistics:
     def calculate_node_adjacency_distribution(n: int, p: float, max_m: int = None) -> dict:
         if max_m is None:
             max_m = n - 1
+        if p < 0 or p > 1:
+            raise ValueError("Probability must be in [0, 1]")
         
-        distribution = {}
-        for m in range(max_m + 1):
-            distribution[m] = StatisticsUtils.probability_m_adjacent(n, m, p)
+        # Whole distribution in one log-space pass; m >= n is outside the support
+        trials = n - 1
+        ks = np.arange(max_m + 1, dtype=np.int64)
+        k_s = np.minimum(ks, trials)
+        log_pmf = (special.gammaln(trials + 1) - special.gammaln(k_s + 1)
+                   - special.gammaln(trials - k_s + 1)
+                   + special.xlogy(k_s, p) + special.xlog1py(trials - k_s, -p))
+        pmf_vals = np.where(ks <= trials, np.exp(log_pmf), 0.0)
         
-        return distribution
+        return dict(zip(ks.tolist(), pmf_vals.tolist()))
     
     @staticmethod
     def calculate_connectivity_threshold(n: int, m: int, target_prob: float,
                                         p_min: float = 0, p_max: float = 1,
                                         tolerance: float = 0.01) -> float:
-        def connectivity_prob(p):
-            Q = StatisticsUtils.probability_at_least_m_adjacent(n, m, p)
-            return StatisticsUtils.m_connectivity_probability(n, m, Q)
-        
-        # Binary search
-        while (p_max - p_min) > tolerance:
-            p_mid = (p_min + p_max) / 2
-            prob = connectivity_prob(p_mid)
-            
-            if prob < target_prob:
-                p_min = p_mid
-            else:
-                p_max = p_mid
+        return _connectivity_threshold(n, m, target_prob, p_min, p_max, tolerance)
+    
+    @staticmethod
+    def calculate_connectivity_threshold_sweep(n: int, m: int, target_probs: np.ndarray,
+                                               n_grid: int = 1001) -> np.ndarray:
+        # Evaluate connectivity once on a p grid, then invert by interpolation
+        p_grid = np.linspace(0, 1, n_grid)
+        if m <= 0:
+            Qs = np.ones_like(p_grid)
+        elif m >= n:
+            Qs = np.zeros_like(p_grid)
+        else:
+            # P(X >= m) for X ~ Bin(n - 1, p) = I_p(m, n - m)
+            Qs = special.betainc(m, n - m, p_grid)
+        conn = Qs ** n
         
-        return (p_min + p_max) / 2
+        return np.interp(np.asarray(target_probs, dtype=np.float64), conn, p_grid)
+
+
+@lru_cache(maxsize=256)
+def _connectivity_prob(n: int, m: int, p: float, log_coeff: float) -> float:
+    # Shared across threshold searches with the same (n, m); p is pre-rounded
+    # and log_coeff = log C(n - 1, m) is hoisted out of the search by the caller
+    if m >= n:
+        Q = 0.0
+    elif m <= 0:
+        Q = 1.0
+    else:
+        Q = _tail_at_least_m(n - 1, m, p, log_coeff)
+    return Q ** n
+
+
+@lru_cache(maxsize=256)
+def _connectivity_threshold(n: int, m: int, target_prob: float,
+                            p_min: float, p_max: float, tolerance: float) -> float:
+    if p_min < 0 or p_max > 1:
+        raise ValueError("Probability must be in [0, 1]")
+    
+    # Everything that depends only on (n, m) is computed once per search
+    log_coeff = _log_binom_coeff(n - 1, m) if 0 < m < n else 0.0
+    
+    def excess(p):
+        return _connectivity_prob(n, m, round(p, 8), log_coeff) - target_prob
+    
+    # _connectivity_prob is monotonic in p; if the target is not bracketed,
+    # the answer is the bracket end a bisection would collapse onto
+    f_min = excess(p_min)
+    if f_min >= 0:
+        return p_min
+    f_max = excess(p_max)
+    if f_max < 0:
+        return p_max
+    
+    # Brent's method converges superlinearly on the smooth crossing
+    return optimize.brentq(excess, p_min, p_max, xtol=tolerance)
 
 
 if __name__ == "__main__":
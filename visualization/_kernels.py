@@ -0,0 +1,33 @@
+"""
+visualization/_kernels.py
+
+Numeric kernels behind the coverage plots (compiled with Numba when available).
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from utils.jit import njit
+
+
+# Compiled eagerly for the one signature the plotter uses, and cached on
+# disk, so later processes load the machine code instead of re-typing it
+@njit(['f8[:, :](f8[:], f8[:], f8[:], f8[:])'], cache=True, fastmath=True)
+def coverage_grid(Pt_arr, Rd_arr, scale_arr, alpha_arr):
+    """
+    l^2 for every elevation pair (rows) along paired Pt/Rd arrays (columns),
+    with the OOK distance (Equation 1) written as l = (scale * Pt / Rd)^(1/alpha)
+    per pair, all fused into one pass. Callers scale by the network-type
+    coverage coefficient, so one result serves every network type
+    """
+    out = np.empty((scale_arr.shape[0], Pt_arr.shape[0]))
+    for j in range(scale_arr.shape[0]):
+        scale = scale_arr[j]
+        two_over_alpha = 2.0 / alpha_arr[j]
+        for i in range(Pt_arr.shape[0]):
+            out[j, i] = (scale * Pt_arr[i] / Rd_arr[i]) ** two_over_alpha
+    return out
@@ -0,0 +1,26 @@
+"""
+visualization/_style.py
+
+Matplotlib setup shared by the coverage and connectivity plotters.
+"""
+
+import os
+
+_STYLE_APPLIED = False
+
+
+def ensure_style():
+    # plt.style.use rewrites global rcParams; once per process is enough
+    global _STYLE_APPLIED
+    if not _STYLE_APPLIED:
+        import matplotlib.pyplot as plt
+        plt.style.use('seaborn-v0_8-darkgrid')
+        _STYLE_APPLIED = True
+
+
+def batch_pyplot():
+    """pyplot for batch export, rendering off-screen when there is no display"""
+    import matplotlib.pyplot as plt
+    if 'DISPLAY' not in os.environ:
+        plt.switch_backend('Agg')
+    return plt
@@ -392,9 +392,10 @@ Connectivity visualization for UV networks.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 
 # Add parent directory to path
@@ -403,94 +404,246 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from config.communication_params import CommunicationParams
 from models.channel.communication_distance import CommunicationDistanceCalculator
 from models.connectivity.m_connectivity import MConnectivityCalculator
+from utils.jit import NUMBA_AVAILABLE
+from visualization._style import batch_pyplot, ensure_style
+
+
+def _readonly(arr: np.ndarray) -> np.ndarray:
+    arr.flags.writeable = False
+    return arr
+
 
 class ConnectivityPlotter:
+    COLORS = ('#1f77b4', '#ff7f0e', '#2ca02c')
+    LINESTYLES = ('-', '--', '-.')
+    colors = COLORS
+    linestyles = LINESTYLES
+    
+    # Default sweeps, built once (read-only since they are shared)
+    _DEFAULT_N_RANGE = _readonly(np.arange(10, 250, 10))
+    _DEFAULT_RD_RANGE = _readonly(np.linspace(10e3, 200e3, 20))
+    _DEFAULT_RD_KBPS = _readonly(_DEFAULT_RD_RANGE / 1e3)
+    _DEFAULT_PT_RANGE = _readonly(np.linspace(0.01, 1.0, 20))
+    _DASHBOARD_N_RANGE = _readonly(np.arange(50, 351, 30))
+    _DASHBOARD_RD_RANGE = _readonly(np.linspace(20e3, 120e3, 15))
+    _DASHBOARD_RD_KBPS = _readonly(_DASHBOARD_RD_RANGE / 1e3)
+    _DASHBOARD_PT_RANGE = _readonly(np.linspace(0.15, 0.5, 15))
+    
     def __init__(self, figsize: Tuple[int, int] = (10, 6)):
         self.figsize = figsize
         self.calc = CommunicationDistanceCalculator()
-        plt.style.use('seaborn-v0_8-darkgrid')
-        self.colors = ['#1f77b4', '#ff7f0e', '#2ca02c']
-        self.linestyles = ['-', '--', '-.']
+        # Same (Pt, Rd, theta1, theta2) points recur across plots in a session
+        self._ook_cache = lru_cache(maxsize=4096)(self.calc.calculate_ook_distance)
+        ensure_style()
+        # Dashboard figure, reused across create_connectivity_dashboard calls
+        self._dash_fig = None
+        self._dash_axes = None
+        # Connectivity per (S_ROI, sample_points): l -> n -> m -> probability,
+        # shared by the standalone plots and the dashboard panels
+        self._unique_l_cache: Dict[Tuple[float, int], Dict[float, Dict[int, Dict[int, float]]]] = {}
+    
+    def reset_figures(self):
+        """Drop the cached dashboard figure so the next dashboard gets a fresh one"""
+        if self._dash_fig is not None:
+            import matplotlib.pyplot as plt
+            plt.close(self._dash_fig)
+        self._dash_fig = None
+        self._dash_axes = None
+    
+    def _ook_distance(self, Pt, Rd, theta1, theta2):
+        # Round so float noise in swept values still hits the cache
+        return self._ook_cache(round(float(Pt), 6), round(float(Rd), 6),
+                               round(float(theta1), 6), round(float(theta2), 6))
+    
+    def _connectivity(self, l, n, m, S_ROI, sample_points=10, use_gpu=False):
+        if use_gpu:
+            # Each plotted curve sweeps either l or n with the other fixed, so
+            # the (L, N) GPU grid flattens straight onto the curve
+            l, n = np.atleast_1d(l), np.atleast_1d(n)
+            conn = MConnectivityCalculator.calculate_connectivity_grid(
+                l, n, m, S_ROI, sample_points, use_gpu=True
+            )
+            return conn.reshape(np.broadcast(l, n).shape)
+        
+        # Connectivity curve over arrays of l and/or n, memoized on rounded inputs
+        l, n = np.broadcast_arrays(np.round(np.asarray(l, dtype=np.float64), 6),
+                                   np.asarray(n, dtype=np.int64))
+        l_flat, n_flat = l.ravel(), n.ravel()
+        cache = self._unique_l_cache.setdefault((round(float(S_ROI), 3), int(sample_points)), {})
+        
+        # Evaluate only the distinct l values (and their n) not seen before
+        l_unique = np.unique(l_flat)
+        l_idx = np.searchsorted(l_unique, l_flat)
+        missing = [i for i in range(l_flat.size)
+                   if m not in cache.get(l_unique[l_idx[i]], {}).get(n_flat[i], {})]
+        if missing:
+            # Single precision is far below what a percent-scale axis can show
+            conn = MConnectivityCalculator.calculate_network_connectivity_probability_vec(
+                l_flat[missing], n_flat[missing], m, S_ROI, sample_points=sample_points,
+                dtype=np.float32
+            )
+            for i, value in zip(missing, conn.tolist()):
+                cache.setdefault(l_unique[l_idx[i]], {}).setdefault(n_flat[i], {})[m] = value
+        
+        out = np.empty(l_flat.size, dtype=np.float32)
+        for i in range(l_flat.size):
+            out[i] = cache[l_unique[l_idx[i]]][n_flat[i]][m]
+        return out.reshape(l.shape)
+    
+    def _connectivity_curves(self, l, n, m_values, S_ROI, use_gpu=False):
+        # The curves for different m are independent. The NumPy path releases
+        # the GIL, so compute them on threads; the compiled prange sweep
+        # already uses every core per curve (and numba's workqueue threading
+        # layer is not thread-safe)
+        if NUMBA_AVAILABLE or len(m_values) < 2:
+            return [self._connectivity(l, n, m, S_ROI, use_gpu=use_gpu) for m in m_values]
+        with ThreadPoolExecutor(max_workers=len(m_values)) as pool:
+            return list(pool.map(lambda m: self._connectivity(l, n, m, S_ROI), m_values))
+    
+    def _draw_curves(self, ax, x, curves, m_values):
+        # All curves as one LineCollection plus one scatter for the markers
+        # (instead of one Line2D per m); returns proxy handles for the legend
+        from matplotlib.collections import LineCollection
+        from matplotlib.lines import Line2D
+        x = np.asarray(x, dtype=np.float64)
+        colors = [self.COLORS[i % len(self.COLORS)] for i in range(len(curves))]
+        styles = [self.LINESTYLES[i % len(self.LINESTYLES)] for i in range(len(curves))]
+        
+        ax.add_collection(LineCollection([np.column_stack((x, y)) for y in curves],
+                                         colors=colors, linestyles=styles, linewidths=2))
+        ax.scatter(np.tile(x, len(curves)), np.concatenate(curves), s=16,
+                   c=np.repeat(colors, x.size), zorder=3)
+        ax.autoscale_view()
+        
+        return [Line2D([], [], color=c, linestyle=ls, linewidth=2, marker='o', markersize=4,
+                       label=f'{m}-connected')
+                for m, c, ls in zip(m_values, colors, styles)]
     
     def plot_connectivity_vs_nodes(self, Pt=0.5, Rd=50e3, theta1=30, theta2=50, S_ROI=1e6, 
-                                  n_range=None, m_values=[1, 2, 3], save_path=None):
-        if n_range is None: n_range = np.arange(10, 250, 10)
+                                  n_range=None, m_values=[1, 2, 3], save_path=None,
+                                  dpi=None, use_gpu=False):
+        n_range = self._DEFAULT_N_RANGE if n_range is None else n_range
         
-        l = self.calc.calculate_ook_distance(Pt, Rd, theta1, theta2)
+        l = self._ook_distance(Pt, Rd, theta1, theta2)
+        import matplotlib.pyplot as plt
         fig, ax = plt.subplots(figsize=self.figsize)
         
-        for i, m in enumerate(m_values):
-            connectivities = []
-            for n in n_range:
-                # Assuming MConnectivityCalculator exists and works
-                conn = MConnectivityCalculator.calculate_network_connectivity_probability(
-                    l, n, m, S_ROI, sample_points=10
-                )
-                connectivities.append(conn * 100)
-            ax.plot(n_range, connectivities, marker='o', label=f'{m}-connected')
+        curves = self._connectivity_curves(l, n_range, m_values, S_ROI, use_gpu)
+        handles = self._draw_curves(ax, n_range, [conn * 100 for conn in curves], m_values)
         
         # 90% Threshold
-        ax.axhline(y=90, color='red', linestyle=':', label='90% threshold')
+        handles.append(ax.axhline(y=90, color='red', linestyle=':', label='90% threshold'))
         ax.set_title(f'Connectivity vs Nodes (l={l:.1f}m)')
         ax.set_ylabel('Connectivity (%)')
         ax.set_xlabel('Number of Nodes')
         ax.set_ylim(0, 105)
-        ax.legend()
-        if save_path: plt.savefig(save_path)
+        ax.legend(handles=handles)
+        if save_path: fig.savefig(save_path, dpi=dpi)
         return fig
 
     def plot_connectivity_vs_rate(self, Pt=0.5, n=300, theta1=30, theta2=50, S_ROI=1e6, 
-                                 Rd_range=None, m_values=[1, 2, 3], save_path=None):
-        if Rd_range is None: Rd_range = np.linspace(10e3, 200e3, 20)
+                                 Rd_range=None, m_values=[1, 2, 3], save_path=None,
+                                 dpi=None, use_gpu=False):
+        if Rd_range is None:
+            Rd_range, rd_kbps = self._DEFAULT_RD_RANGE, self._DEFAULT_RD_KBPS
+        else:
+            rd_kbps = np.asarray(Rd_range, dtype=np.float64) / 1e3
         
+        # Communication distance does not depend on m
+        l_arr = self.calc.calculate_ook_distance_vec(Pt, Rd_range, theta1, theta2)
+        
+        import matplotlib.pyplot as plt
         fig, ax = plt.subplots(figsize=self.figsize)
-        for i, m in enumerate(m_values):
-            connectivities = []
-            for Rd in Rd_range:
-                l = self.calc.calculate_ook_distance(Pt, Rd, theta1, theta2)
-                conn = MConnectivityCalculator.calculate_network_connectivity_probability(
-                    l, n, m, S_ROI, sample_points=10
-                )
-                connectivities.append(conn * 100)
-            ax.plot(Rd_range/1e3, connectivities, marker='o', label=f'{m}-connected')
+        curves = self._connectivity_curves(l_arr, n, m_values, S_ROI, use_gpu)
+        handles = self._draw_curves(ax, rd_kbps, [conn * 100 for conn in curves], m_values)
             
-        ax.axhline(y=90, color='red', linestyle=':', label='90% threshold')
+        handles.append(ax.axhline(y=90, color='red', linestyle=':', label='90% threshold'))
         ax.set_title(f'Connectivity vs Data Rate')
         ax.set_ylabel('Connectivity (%)')
         ax.set_xlabel('Data Rate (kbps)')
         ax.set_ylim(0, 105)
-        ax.legend()
-        if save_path: plt.savefig(save_path)
+        ax.legend(handles=handles)
+        if save_path: fig.savefig(save_path, dpi=dpi)
         return fig
 
     def plot_connectivity_vs_power(self, Rd=50e3, n=300, theta1=30, theta2=50, S_ROI=1e6, 
-                                  Pt_range=None, m_values=[1, 2, 3], save_path=None):
-        if Pt_range is None: Pt_range = np.linspace(0.01, 1.0, 20)
+                                  Pt_range=None, m_values=[1, 2, 3], save_path=None,
+                                  dpi=None, use_gpu=False):
+        Pt_range = self._DEFAULT_PT_RANGE if Pt_range is None else Pt_range
+        
+        # Communication distance does not depend on m
+        l_arr = self.calc.calculate_ook_distance_vec(Pt_range, Rd, theta1, theta2)
         
+        import matplotlib.pyplot as plt
         fig, ax = plt.subplots(figsize=self.figsize)
-        for i, m in enumerate(m_values):
-            connectivities = []
-            for Pt in Pt_range:
-                l = self.calc.calculate_ook_distance(Pt, Rd, theta1, theta2)
-                conn = MConnectivityCalculator.calculate_network_connectivity_probability(
-                    l, n, m, S_ROI, sample_points=10
-                )
-                connectivities.append(conn * 100)
-            ax.plot(Pt_range, connectivities, marker='o', label=f'{m}-connected')
+        curves = self._connectivity_curves(l_arr, n, m_values, S_ROI, use_gpu)
+        handles = self._draw_curves(ax, Pt_range, [conn * 100 for conn in curves], m_values)
             
-        ax.axhline(y=90, color='red', linestyle=':', label='90% threshold')
+        handles.append(ax.axhline(y=90, color='red', linestyle=':', label='90% threshold'))
         ax.set_title(f'Connectivity vs Power')
         ax.set_ylabel('Connectivity (%)')
         ax.set_xlabel('Power (W)')
         ax.set_ylim(0, 105)
-        ax.legend()
-        if save_path: plt.savefig(save_path)
+        ax.legend(handles=handles)
+        if save_path: fig.savefig(save_path, dpi=dpi)
+        return fig
+
+    def create_connectivity_dashboard(self, Pt_default=0.5, Rd_default=50e3, n_default=300,
+                                      theta1=30, theta2=50, S_ROI=1e6, save_path=None,
+                                      dpi=None, use_gpu=False):
+        # Figures 16-18 side by side; shares cached curves with the single plots
+        m_values = [1, 2, 3]
+        n_range = self._DASHBOARD_N_RANGE
+        Rd_range = self._DASHBOARD_RD_RANGE
+        Pt_range = self._DASHBOARD_PT_RANGE
+        
+        # All distances and curves first, then one drawing pass
+        l_nodes = self._ook_distance(Pt_default, Rd_default, theta1, theta2)
+        l_rates = self.calc.calculate_ook_distance_vec(Pt_default, Rd_range, theta1, theta2)
+        l_powers = self.calc.calculate_ook_distance_vec(Pt_range, Rd_default, theta1, theta2)
+        
+        panels = [
+            (n_range, self._connectivity_curves(l_nodes, n_range, m_values, S_ROI, use_gpu),
+             'Connectivity vs Nodes', 'Number of Nodes'),                        # Figure 16
+            (self._DASHBOARD_RD_KBPS, self._connectivity_curves(l_rates, n_default, m_values, S_ROI, use_gpu),
+             'Connectivity vs Data Rate', 'Data Rate (kbps)'),                   # Figure 17
+            (Pt_range, self._connectivity_curves(l_powers, n_default, m_values, S_ROI, use_gpu),
+             'Connectivity vs Power', 'Power (W)'),                              # Figure 18
+        ]
+        
+        # Redraw into the previous dashboard when it is still open; building
+        # the figure, gridspec and axes is the expensive part
+        import matplotlib.pyplot as plt
+        if self._dash_fig is None or not plt.fignum_exists(self._dash_fig.number):
+            fig = plt.figure(figsize=(16, 5))
+            gs = fig.add_gridspec(1, 3, hspace=0.3, wspace=0.3)
+            self._dash_fig = fig
+            self._dash_axes = [fig.add_subplot(gs[0, col]) for col in range(3)]
+        else:
+            fig = self._dash_fig
+            for ax in self._dash_axes:
+                ax.cla()
+        
+        for ax, (x, curves, title, xlabel) in zip(self._dash_axes, panels):
+            handles = self._draw_curves(ax, x, [conn * 100 for conn in curves], m_values)
+            ax.axhline(y=90, color='red', linestyle=':')
+            ax.set_title(title)
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel('Connectivity (%)')
+            ax.set_ylim(0, 105)
+            ax.legend(handles=handles)
+        
+        fig.suptitle(f'UV Network Connectivity Analysis ({theta1}°-{theta2}°, S_ROI={S_ROI:.0e}m²)',
+                     fontsize=16, fontweight='bold', y=1.02)
+        if save_path: fig.savefig(save_path, dpi=dpi, bbox_inches='tight')
         return fig
 
 if __name__ == "__main__":
+    plt = batch_pyplot()
+    
     cp = ConnectivityPlotter()
     print("Generating connectivity plots...")
-    cp.plot_connectivity_vs_nodes(save_path='visualization/conn_nodes_sim.png')
-    cp.plot_connectivity_vs_rate(save_path='visualization/conn_rate_sim.png')
-    cp.plot_connectivity_vs_power(save_path='visualization/conn_power_sim.png')
+    plt.close(cp.plot_connectivity_vs_nodes(save_path='visualization/conn_nodes_sim.png'))
+    plt.close(cp.plot_connectivity_vs_rate(save_path='visualization/conn_rate_sim.png'))
+    plt.close(cp.plot_connectivity_vs_power(save_path='visualization/conn_power_sim.png'))
     print("Done.")
\ No newline at end of file
@@ -450,9 +450,10 @@ Reproduces Figures 10-15 from the paper.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 import sys
 import os
+from functools import lru_cache
+from math import pi, sqrt
 from typing import Dict, List, Tuple, Optional
 
 # Add parent directory to path
@@ -460,6 +461,36 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from config.communication_params import CommunicationParams
 from models.channel.communication_distance import CommunicationDistanceCalculator
+from visualization._style import batch_pyplot, ensure_style
+
+# S_4-eff / l^2 for the 4-node square network (Equation 10)
+_SQRT3 = sqrt(3.0)
+_FIVE_THIRDS_PI = 5.0 * pi / 3.0
+_COEFF_4NODE = 1.0 + _SQRT3 + _FIVE_THIRDS_PI
+# S_eff / l^2 for a single node (Equation 17: πl²/2 + S1 - S2)
+_COEFF_SINGLE_NODE = _FIVE_THIRDS_PI / 4.0 + _SQRT3 / 4.0
+_COVERAGE_COEFFS = {'4-node': _COEFF_4NODE, 'single-node': _COEFF_SINGLE_NODE}
+
+# Sweeps longer than this are resampled onto this many evenly spaced points
+_MAX_SWEEP_POINTS = 64
+
+
+def _cap_points(x_range, max_points):
+    # A line plot gains nothing visible from more points than this; keeps the
+    # cost of a user-supplied dense sweep bounded
+    x_range = np.asarray(x_range, dtype=np.float64)
+    if max_points is not None and x_range.size > max_points:
+        x_range = np.linspace(x_range[0], x_range[-1], max_points)
+    return x_range
+
+
+# Per-curve style, applied through each axes' property cycle
+_COLORS = ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728')
+_MARKERS = ('+', 's', 'o', '*')
+
+# Above this many elevation combinations the curves are drawn as one LineCollection
+_WIDE_SWEEP = 8
+
 
 class CoveragePlotter:
     """
@@ -469,82 +500,196 @@ class CoveragePlotter:
     def __init__(self, figsize: Tuple[int, int] = (10, 6)):
         self.figsize = figsize
         self.calc = CommunicationDistanceCalculator()
-        plt.style.use('seaborn-v0_8-darkgrid')
+        # l² curves per (sweep, fixed value, elevation pairs, range); every
+        # network type and plot scales the same arrays
+        self._l_sq_cache = lru_cache(maxsize=128)(self._l_sq_curves)
+        ensure_style()
+    
+    def _make_axes(self, **kw):
+        import matplotlib.pyplot as plt
+        fig, ax = plt.subplots(figsize=self.figsize, **kw)
+        ax.grid(True, alpha=0.3)
+        return fig, ax
     
     def calculate_effective_coverage(self, l: float) -> float:
         """
-        Calculate effective coverage area for a 4-node square network.
+        Calculate effective coverage area for a 4-node square network
+        (l may be a scalar or an array of distances).
         Formula derived in paper Equation (10).
         S_4-eff = (1 + sqrt(3) + 5/3 * pi) * l^2
         """
-        coeff = 1 + np.sqrt(3) + (5/3 * np.pi)
-        return coeff * (l ** 2)
+        return _COEFF_4NODE * (l * l)
+    
+    def _l_sq_curves(self, sweep, param, pairs, x_key):
+        x = np.array(x_key, dtype=np.float64)
+        fixed = np.full(x.shape, param)
+        Pt_arr, Rd_arr = (x, fixed) if sweep == 'power' else (fixed, x)
+        # Distances and l² for every pair fused in one compiled pass; the
+        # kernel module (and numba) is only loaded once a curve is needed
+        from visualization._kernels import coverage_grid
+        theta = np.array(pairs, dtype=np.float64).reshape(-1, 2)
+        scale, alpha = self.calc.calculate_ook_coefficients(theta[:, 0], theta[:, 1])
+        l_sq = coverage_grid(Pt_arr, Rd_arr, scale, alpha)
+        # Read-only since the cached curves are shared between plots
+        l_sq.flags.writeable = False
+        return l_sq
+    
+    def _coverage_curves(self, sweep, param, x_range, combinations, network_type='4-node',
+                         unit=1.0, out=None):
+        """
+        Effective coverage along a Pt sweep (sweep='power', param = Rd) or an
+        Rd sweep (sweep='rate', param = Pt) for every (theta1, theta2) in
+        combinations, as an (n_combinations, n_points) array in multiples of
+        unit. l² is memoized per sweep, so each network type only rescales the
+        cached curves; the result is written into out when one is given.
+        """
+        x_key = tuple(np.asarray(x_range, dtype=np.float64).tolist())
+        pairs = tuple((float(theta1), float(theta2)) for theta1, theta2 in combinations)
+        l_sq = self._l_sq_cache(sweep, float(param), pairs, x_key)
+        return np.multiply(_COVERAGE_COEFFS[network_type] / unit, l_sq, out=out)
+    
+    def _draw_curves(self, ax, x, curves, combinations):
+        # curves is (n_combinations, n_points). The usual handful of curves is
+        # drawn with one ax.plot call (a Line2D per row); wide sweeps go into a
+        # single unmarked LineCollection. Data artists are
+        # rasterized so vector outputs (PDF/SVG) keep only axes and text as
+        # vectors. Returns legend handles
+        labels = [f'θ1={theta1}°, θ2={theta2}°' for theta1, theta2 in combinations]
+        # Single precision is plenty on screen and halves what the renderer walks
+        curves = np.asarray(curves, dtype=np.float32)
+        if len(combinations) <= _WIDE_SWEEP:
+            # At most ~20 markers per curve however dense the sweep
+            markevery = max(1, len(x) // 20)
+            ax.set_prop_cycle(color=_COLORS, marker=_MARKERS)
+            lines = ax.plot(x, curves.T, markevery=markevery, rasterized=True)
+            for line, label in zip(lines, labels):
+                line.set_label(label)
+            return lines
+        
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import LineCollection
+        from matplotlib.lines import Line2D
+        
+        cycle = plt.rcParams['axes.prop_cycle'].by_key()['color']
+        colors = [cycle[i % len(cycle)] for i in range(len(curves))]
+        ax.add_collection(LineCollection([np.column_stack((x, y)) for y in curves],
+                                         colors=colors, linewidths=1.5, rasterized=True))
+        ax.autoscale_view()
+        return [Line2D([], [], color=c, linewidth=1.5, label=label)
+                for c, label in zip(colors, labels)]
 
-    def plot_coverage_vs_power(self, Rd=50e3, combinations=None, save_path=None):
-        """Reproduce Figure 11: Effective coverage vs Power"""
+    def plot_coverage_vs_power(self, Rd=50e3, combinations=None, save_path=None, dpi=150,
+                               Pt_range=None, max_points=_MAX_SWEEP_POINTS):
+        """
+        Reproduce Figure 11: Effective coverage vs Power.
+        Pt_range longer than max_points is resampled to max_points evenly
+        spaced values (max_points=None plots every point); markers are drawn
+        on every len(Pt_range) // 20-th point so at most ~20 appear per curve.
+        """
         if combinations is None:
             combinations = [(30, 30), (50, 30), (30, 50), (50, 50)]
-            
-        Pt_range = np.linspace(0.01, 0.5, 20)
-        fig, ax = plt.subplots(figsize=self.figsize)
         
-        markers = ['+', 's', 'o', '*']
+        if Pt_range is None:
+            Pt_range = np.linspace(0.01, 0.5, 20)
+        Pt_range = _cap_points(Pt_range, max_points)
+        fig, ax = self._make_axes()
         
-        for i, (theta1, theta2) in enumerate(combinations):
-            areas = []
-            for Pt in Pt_range:
-                l = self.calc.calculate_ook_distance(Pt, Rd, theta1, theta2)
-                area = self.calculate_effective_coverage(l)
-                areas.append(area)
-            
-            ax.plot(Pt_range, areas, marker=markers[i % len(markers)], 
-                   label=f'θ1={theta1}°, θ2={theta2}°')
+        curves = self._coverage_curves('power', Rd, Pt_range, combinations)
+        handles = self._draw_curves(ax, Pt_range, curves, combinations)
             
         ax.set_xlabel('Transmission Power (W)')
         ax.set_ylabel('4-node Effective Coverage Area (m²)')
         ax.set_title('Effective Coverage Area vs Transmission Power')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
+        ax.legend(handles=handles)
         ax.ticklabel_format(style='sci', axis='y', scilimits=(0,0))
         
         if save_path:
-            plt.savefig(save_path, dpi=300)
+            fig.savefig(save_path, dpi=dpi)
         return fig
 
-    def plot_coverage_vs_rate(self, Pt=0.5, combinations=None, save_path=None):
-        """Reproduce Figure 13: Effective coverage vs Data Rate"""
+    def plot_coverage_vs_rate(self, Pt=0.5, combinations=None, save_path=None, dpi=150,
+                              Rd_range=None, max_points=_MAX_SWEEP_POINTS):
+        """
+        Reproduce Figure 13: Effective coverage vs Data Rate.
+        Rd_range longer than max_points is resampled to max_points evenly
+        spaced values (max_points=None plots every point); markers are drawn
+        on every len(Rd_range) // 20-th point so at most ~20 appear per curve.
+        """
         if combinations is None:
             combinations = [(30, 30), (50, 30), (30, 50), (50, 50)]
-            
-        Rd_range = np.linspace(10e3, 120e3, 20)
-        fig, ax = plt.subplots(figsize=self.figsize)
         
-        markers = ['+', 's', 'o', '*']
+        if Rd_range is None:
+            Rd_range = np.linspace(10e3, 120e3, 20)
+        Rd_range = _cap_points(Rd_range, max_points)
+        fig, ax = self._make_axes()
         
-        for i, (theta1, theta2) in enumerate(combinations):
-            areas = []
-            for Rd in Rd_range:
-                l = self.calc.calculate_ook_distance(Pt, Rd, theta1, theta2)
-                area = self.calculate_effective_coverage(l)
-                areas.append(area)
-            
-            ax.plot(Rd_range/1e3, areas, marker=markers[i % len(markers)], 
-                   label=f'θ1={theta1}°, θ2={theta2}°')
+        curves = self._coverage_curves('rate', Pt, Rd_range, combinations)
+        handles = self._draw_curves(ax, Rd_range/1e3, curves, combinations)
             
         ax.set_yscale('log')
         ax.set_xlabel('Data Rate (kbps)')
         ax.set_ylabel('4-node Effective Coverage Area (m²)')
         ax.set_title('Effective Coverage Area vs Data Rate')
-        ax.legend()
+        ax.legend(handles=handles)
         ax.grid(True, which='both', alpha=0.3)
         
         if save_path:
-            plt.savefig(save_path, dpi=300)
+            fig.savefig(save_path, dpi=dpi)
+        return fig
+
+    def create_coverage_comparison_dashboard(self, Pt_default=0.5, Rd_default=50e3,
+                                             combinations=None, save_path=None, dpi=150):
+        """
+        Coverage vs power and vs data rate for 4-node and single-node networks.
+        Both network types scale the same l² sweeps, so the four panels are
+        drawn from two sets of cached curves.
+        """
+        if combinations is None:
+            combinations = CommunicationParams.ELEVATION_COMBINATIONS
+        
+        n_points = 15
+        Pt_range = np.linspace(0.1, 0.5, n_points)
+        Rd_range = np.linspace(10e3, 120e3, n_points)
+        # One buffer for all four panels; _draw_curves hands matplotlib a
+        # float32 copy, so it is free to be overwritten by the next panel
+        curves = np.empty((len(combinations), n_points))
+        import matplotlib.pyplot as plt
+        fig = plt.figure(figsize=(16, 10))
+        gs = fig.add_gridspec(2, 2, hspace=0.3, wspace=0.3)
+        panels = [
+            (gs[0, 0], 'power', Rd_default, Pt_range, Pt_range, '4-node', 1e4,
+             'Power (W)', '4-Node Coverage (×10⁴ m²)', 'Coverage vs Power'),
+            (gs[0, 1], 'rate', Pt_default, Rd_range, Rd_range/1e3, '4-node', 1e4,
+             'Data Rate (kbps)', '4-Node Coverage (×10⁴ m²)', 'Coverage vs Data Rate'),
+            (gs[1, 0], 'power', Rd_default, Pt_range, Pt_range, 'single-node', 1e3,
+             'Power (W)', 'Single-Node Coverage (×10³ m²)', 'Single-Node Coverage vs Power'),
+            (gs[1, 1], 'rate', Pt_default, Rd_range, Rd_range/1e3, 'single-node', 1e3,
+             'Data Rate (kbps)', 'Single-Node Coverage (×10³ m²)', 'Single-Node Coverage vs Data Rate'),
+        ]
+        
+        for spec, sweep, param, x_range, x, network_type, unit, xlabel, ylabel, title in panels:
+            ax = fig.add_subplot(spec)
+            self._coverage_curves(sweep, param, x_range, combinations, network_type,
+                                  unit=unit, out=curves)
+            handles = self._draw_curves(ax, x, curves, combinations)
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel(ylabel)
+            ax.set_title(title)
+            ax.legend(handles=handles)
+            ax.grid(True, alpha=0.3)
+        
+        fig.suptitle('UV Network Coverage Analysis Dashboard',
+                     fontsize=16, fontweight='bold', y=0.995)
+        
+        if save_path:
+            fig.savefig(save_path, dpi=dpi, bbox_inches='tight')
         return fig
 
 if __name__ == "__main__":
+    plt = batch_pyplot()
+    
     cp = CoveragePlotter()
     print("Generating coverage plots...")
-    cp.plot_coverage_vs_power(save_path='visualization/coverage_power_sim.png')
-    cp.plot_coverage_vs_rate(save_path='visualization/coverage_rate_sim.png')
+    plt.close(cp.plot_coverage_vs_power(save_path='visualization/coverage_power_sim.png'))
+    plt.close(cp.plot_coverage_vs_rate(save_path='visualization/coverage_rate_sim.png'))
     print("Done.")
\ No newline at end of file